@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Benchmark of the per-row cost of the getIconPathForFileType callback.
+#   Compares the old per-call path building against the precomputed lookup
+#   used by Prism_ResolveShortcuts_Functions.setIcon().
+#
+#   If Prism's Python environment is available (qtpy and PrismUtils importable,
+#   e.g. "--prism-scripts C:/Prism2/Scripts"), the real plugin method is also
+#   measured, including the err_catcher wrapper.
+#
+####################################################
+
+
+import os
+import sys
+import json
+import timeit
+import logging
+import argparse
+
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "ResolveShortcuts",
+                           "Scripts"
+                           )
+EXTENSION = ".resolveShortcut"
+ROW_EXTENSIONS = [".blend", ".hip", ".nk", EXTENSION, ".ma", ".aep"]
+
+logger = logging.getLogger("bench_icon_lookup")
+
+
+#   The setIcon() Body Before the Icon Path was Precomputed
+def legacySetIcon(pluginLocation, extension, shortcutsEnabled=True, useIcon=True):
+    if shortcutsEnabled and useIcon:
+        if extension == EXTENSION:
+            icon = os.path.join(pluginLocation, "UserInterfaces", "ResolveShortcuts.ico")
+            logger.debug("Loaded ResolveShortcut Icon")
+            return icon
+
+    return None
+
+
+#   Instance of the Real Plugin Class with Only the Attributes setIcon() Needs
+def getPluginInstance(pluginLocation):
+    from Prism_ResolveShortcuts_Functions import Prism_ResolveShortcuts_Functions
+
+    plugin = Prism_ResolveShortcuts_Functions.__new__(Prism_ResolveShortcuts_Functions)
+    plugin.pluginLocation = pluginLocation
+    plugin.shortcutsEnabled = True
+    plugin.useIcon = True
+    plugin.iconPaths = {}
+    plugin.iconState = None
+    plugin.shortcutIcon = None
+    plugin.updateIconCache()
+    return plugin
+
+
+def perRowNs(func, rows):
+    calls = rows * len(ROW_EXTENSIONS)
+    seconds = min(timeit.repeat(lambda: [func(ext) for ext in ROW_EXTENSIONS * rows], number=1, repeat=5))
+    return seconds / calls * 1e9
+
+
+def run(rows=10000, prismScripts=None):
+    pluginLocation = os.path.dirname(SCRIPTS_DIR)
+    iconPaths = {EXTENSION: os.path.join(pluginLocation, "UserInterfaces", "ResolveShortcuts.ico")}
+
+    results = {"rows": rows,
+               "legacy_ns_per_row": perRowNs(lambda ext: legacySetIcon(pluginLocation, ext), rows),
+               "lookup_ns_per_row": perRowNs(iconPaths.get, rows)
+               }
+
+    sys.path.insert(0, SCRIPTS_DIR)
+    if prismScripts:
+        sys.path.insert(0, prismScripts)
+
+    try:
+        plugin = getPluginInstance(pluginLocation)
+        results["plugin_setIcon_ns_per_row"] = perRowNs(plugin.setIcon, rows)
+    except ImportError as e:
+        results["plugin_setIcon_ns_per_row"] = None
+        results["plugin_skipped"] = f"Prism environment not available: {e}"
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the shortcut icon lookup")
+    parser.add_argument("--rows", type=int, default=10000, help="Scenefile rows per repeat")
+    parser.add_argument("--prism-scripts", default=None, help="Prism Scripts directory, to measure the real plugin method")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rows, args.prism_scripts), indent=2))
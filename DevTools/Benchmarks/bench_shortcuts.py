@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Benchmark suite for the shortcut open and save paths.  Runs the real loader
+#   (DvResolve_Project_Shortcuts) from a temporary copy of the plugin against
+#   the fake DaVinciResolveScript in DevTools/FakeResolve, with a per-call
+#   delay standing in for Resolve's IPC cost.
+#
+#   Measures config parsing, shortcut template rendering, shortcut path
+#   parsing, folder navigation, timeline lookup at 10/100/1000 timelines, and
+#   end-to-end open and save.  Resolve API call counts are recorded with each
+#   result, and the calls that should not happen (an extra GotoRootFolder, or
+#   reloading a project that is already open) are listed under "regressions".
+#
+#   Results are written as JSON to compare plugin versions:
+#       python bench_shortcuts.py --output results.json
+#
+####################################################
+
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import timeit
+import platform
+import tempfile
+import argparse
+import contextlib
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SCRIPTS_DIR = os.path.join(REPO_DIR, "ResolveShortcuts", "Scripts")
+FAKE_DIR = os.path.join(REPO_DIR, "DevTools", "FakeResolve")
+TIMELINE_COUNTS = [10, 100, 1000]
+DB_NAME = "Local Database"
+
+#   Projects in the Fake's Default Library
+REEL_FOLDERS = ["Shows", "ShowA", "Reels"]
+EDIT_FOLDERS = ["Shows", "ShowA"]
+OTHER_FOLDERS = ["Shows", "ShowB"]
+
+
+#   Copies the Plugin Scripts to a Temp Plugin Folder with a Config Pointing at the Fake
+def makePlugin(tempDir, processTimeout=5):
+    pluginDir = os.path.join(tempDir, "ResolveShortcuts")
+    shutil.copytree(SCRIPTS_DIR, os.path.join(pluginDir, "Scripts"),
+                    ignore=shutil.ignore_patterns("__pycache__"))
+
+    sys.path.insert(0, os.path.join(pluginDir, "Scripts"))
+    from ResolveShortcuts_Config import getConfigPath, saveConfig
+
+    saveConfig(getConfigPath(pluginDir), {"current_plugin_version": "benchmark",
+                                          "python_exe_path": sys.executable,
+                                          "plugin_path": pluginDir,
+                                          "dvr_script_path": FAKE_DIR,
+                                          "resolve_exe": os.path.join(FAKE_DIR, "resolve"),
+                                          "shortcuts_enabled": "True",
+                                          "process_timeout": str(processTimeout),
+                                          "api_timeout": str(processTimeout),
+                                          "project_timeout": str(processTimeout)
+                                          })
+    return pluginDir
+
+
+#   Best and Mean Time per Call of a Fast, Resolve-free Function
+def timeFast(func, number=1000, repeat=5):
+    times = timeit.repeat(func, number=number, repeat=repeat)
+    return {"best_us": min(times) / number * 1e6,
+            "mean_us": sum(times) / len(times) / number * 1e6,
+            "calls_per_repeat": number
+            }
+
+
+#   Runs func() Against the Fake, Returning the Elapsed ms and the API Calls it Made
+def timeApi(dvr, func, quiet=True):
+    dvr.resetCalls()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output if quiet else sys.stdout):
+        value = func()
+    elapsed = time.perf_counter() - start
+
+    return {"ms": elapsed * 1000, "calls": dvr.getCalls(), "api_calls": sum(dvr.getCalls().values())}, value
+
+
+def benchConfig(pluginDir):
+    import ResolveShortcuts_Config as config
+
+    configPath = config.getConfigPath(pluginDir)
+    with open(configPath, "r") as file:
+        text = file.read()
+
+    def loadUncached():
+        config._cache.clear()
+        return config.loadConfig(configPath)
+
+    return {"parse": timeFast(lambda: config.parseConfig(text)),
+            "load_cached": timeFast(lambda: config.loadConfig(configPath)),
+            "load_uncached": timeFast(loadUncached)
+            }
+
+
+def benchTemplate(rs):
+    rs.pluginVersion = "benchmark"
+    rs.currProjectId = "1D7570F6-F57B-5772-BA9B-04F3E46AF6DD"
+    template = rs.loadTemplate()
+    projectPath = DB_NAME + "\\Shows\\ShowA\\ShowA_Edit\\<Edit_Timeline_0007>"
+
+    return {"load_template": timeFast(rs.loadTemplate),
+            "render": timeFast(lambda: rs.renderShortcut(template, projectPath, 7, "E725DDD3-BA1C-5C91")),
+            "load_and_render": timeFast(lambda: rs.renderShortcut(rs.loadTemplate(), projectPath, 7, "E725DDD3"))
+            }
+
+
+def benchPathParsing(rs):
+    paths = {"root_project": DB_NAME + "\\Sandbox",
+             "nested_timeline": DB_NAME + "\\Shows\\ShowA\\Reels\\ShowA_Reel1\\<Reel1_Timeline_0010>",
+             "deep_timeline": DB_NAME + "\\" + "\\".join(f"Folder{index}" for index in range(12)) + "\\Project\\<Main>"
+             }
+
+    return {name: timeFast(lambda path=path: rs.parseProjectPath(path), number=10000) for name, path in paths.items()}
+
+
+#   Fresh Loader State Connected to the Fake, with an Empty Project Cache
+def connect(rs):
+    rs.resolve = None
+    rs.currentFolders = None
+    rs.projectCache = {"projects": {}}
+    rs.getResolve()
+    rs.pm = rs.resolve.GetProjectManager()
+
+
+#   Folder Navigation from a Cold Start, from the Same Folder and from a Sibling Folder
+def benchNavigation(rs, dvr):
+    connect(rs)
+    results = {}
+
+    results["cold_to_reels"], _ = timeApi(dvr, lambda: rs.navigateToFolder(REEL_FOLDERS, DB_NAME))
+    results["same_folder"], _ = timeApi(dvr, lambda: rs.navigateToFolder(REEL_FOLDERS, DB_NAME))
+    results["sibling_folder"], _ = timeApi(dvr, lambda: rs.navigateToFolder(OTHER_FOLDERS, DB_NAME))
+
+    rs.currentFolders = None
+    rs.projectCache = {"projects": {}}
+    results["unknown_to_root"], _ = timeApi(dvr, lambda: rs.navigateToFolder([], DB_NAME))
+
+    return results
+
+
+#   findTimeline() with a Valid Hint, a Stale Hint and no Hint, for the Last Timeline
+def benchTimelineLookup(rs, dvr, counts):
+    results = {}
+
+    for count in counts:
+        dvr.configure(timelines=count)
+        connect(rs)
+        rs.navigateToFolder(EDIT_FOLDERS, DB_NAME)
+        project = rs.pm.LoadProject("ShowA_Edit")
+
+        timeline = project.GetTimelineByIndex(count)
+        name = timeline.GetName()
+        uid = timeline.GetUniqueId()
+
+        results[str(count)] = {
+            "hint": timeApi(dvr, lambda: rs.findTimeline(project, name, count, uid))[0],
+            "stale_hint": timeApi(dvr, lambda: rs.findTimeline(project, name, 1, uid))[0],
+            "scan": timeApi(dvr, lambda: rs.findTimeline(project, name))[0]
+            }
+
+    dvr.configure(timelines=TIMELINE_COUNTS[0])
+    return results
+
+
+#   End-to-end Opens, Starting with Another Project Open
+def benchOpen(rs, dvr, regressions):
+    connect(rs)
+    rs.navigateToFolder([], DB_NAME)
+    rs.pm.LoadProject("Sandbox")
+    rs.currentFolders = None
+
+    reelPath = DB_NAME + "\\Shows\\ShowA\\Reels\\ShowA_Reel1\\<Reel1_Timeline_0010>"
+    editPath = DB_NAME + "\\Shows\\ShowA\\ShowA_Edit\\<Edit_Timeline_0005>"
+    results = {}
+
+    results["other_project_open"], _ = timeApi(dvr, lambda: rs.openResolveProject(reelPath, timelineIndex=10))
+    reelId = rs.getUniqueId(rs.pm.GetCurrentProject())
+
+    results["already_open"], _ = timeApi(dvr, lambda: rs.openResolveProject(reelPath, timelineIndex=10,
+                                                                            projectId=reelId))
+    results["nearby_project"], _ = timeApi(dvr, lambda: rs.openResolveProject(editPath, timelineIndex=5))
+
+    #   Calls that Point to a Regression, as (Scenario, Call, Allowed Count)
+    checks = [("other_project_open", "GotoRootFolder", 1),
+              ("other_project_open", "LoadProject", 1),
+              ("already_open", "LoadProject", 0),
+              ("already_open", "GotoRootFolder", 0),
+              ("already_open", "GotoParentFolder", 0),
+              ("nearby_project", "GotoRootFolder", 0),
+              ("nearby_project", "LoadProject", 1)
+              ]
+    for scenario, call, allowed in checks:
+        count = results[scenario]["calls"].get(call, 0)
+        if count > allowed:
+            regressions.append(f"open/{scenario}: {call} called {count} times (expected at most {allowed})")
+
+    return results
+
+
+#   End-to-end Saves of the Current Timeline: Cold, and a Warm Repeat that Reuses the Timeline Index
+def benchSave(rs, dvr, tempDir, regressions):
+    connect(rs)
+    rs.navigateToFolder(REEL_FOLDERS, DB_NAME)
+    rs.pm.LoadProject("ShowA_Reel1")
+    rs.currentFolders = None
+    rs.projectCache = {"projects": {}}
+    savePath = os.path.join(tempDir, "Shortcuts", "bench.resolveShortcut")
+
+    results = {}
+    results["cold"], _ = timeApi(dvr, lambda: rs.saveProjectShortcut(savePath))
+    results["warm_repeat"], _ = timeApi(dvr, lambda: rs.saveProjectShortcut(savePath))
+
+    for scenario in results:
+        if results[scenario]["calls"].get("LoadProject", 0):
+            regressions.append(f"save/{scenario}: the project was reloaded")
+
+    if results["warm_repeat"]["calls"].get("GetTimelineByIndex", 0) > 1:
+        regressions.append("save/warm_repeat: the timelines were scanned again")
+
+    return results
+
+
+def run(ipcMs=1.0, counts=TIMELINE_COUNTS):
+    tempDir = tempfile.mkdtemp(prefix="ResolveShortcutsBench")
+    try:
+        pluginDir = makePlugin(tempDir)
+        sys.path.insert(0, FAKE_DIR)
+
+        import DaVinciResolveScript as dvr
+        from DvResolve_Project_Shortcuts import ResolveShortcuts
+
+        dvr.configure(running=True, startupDelay=0, latency=ipcMs / 1000.0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            rs = ResolveShortcuts()
+
+        regressions = []
+        benchmarks = {"config": benchConfig(pluginDir),
+                      "template": benchTemplate(rs),
+                      "path_parsing": benchPathParsing(rs),
+                      "navigation": benchNavigation(rs, dvr),
+                      "timeline_lookup": benchTimelineLookup(rs, dvr, counts),
+                      "open": benchOpen(rs, dvr, regressions),
+                      "save": benchSave(rs, dvr, tempDir, regressions)
+                      }
+
+        return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "ipc_ms": ipcMs,
+                "benchmarks": benchmarks,
+                "regressions": regressions
+                }
+
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the shortcut open and save paths against a fake Resolve")
+    parser.add_argument("--ipc-ms", type=float, default=1.0, help="Simulated delay of each Resolve API call")
+    parser.add_argument("--timelines", type=int, nargs="+", default=TIMELINE_COUNTS, help="Timeline counts to test")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    results = run(args.ipc_ms, args.timelines)
+    text = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+        print(f"Results written to {args.output}")
+    else:
+        print(text)
+
+    for regression in results["regressions"]:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+
+    sys.exit(1 if results["regressions"] else 0)
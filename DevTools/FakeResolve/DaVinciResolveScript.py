@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Stand-in for Resolve's DaVinciResolveScript module, so the shortcut loader
+#   can run end-to-end on a machine without Resolve.  Point "dvr_script_path"
+#   in ResolveShortcuts_Config.txt (or sys.path) at this folder.
+#
+#   Models the Project Manager folder tree for each database, projects,
+#   timelines, the media pool selection and the gallery, and counts every
+#   API call.  Latency, startup delay and failures can be injected with
+#   configure() or with environment variables:
+#
+#       FAKE_RESOLVE_LATENCY          seconds added to every API call
+#       FAKE_RESOLVE_LATENCIES        per method, "LoadProject=1.5,OpenFolder=0.05"
+#       FAKE_RESOLVE_FAILURES         failure chance per method, "LoadProject=0.5"
+#       FAKE_RESOLVE_STARTUP_DELAY    seconds after launch before scriptapp() connects
+#       FAKE_RESOLVE_RUNNING          "0" to start not running (see the "resolve" script)
+#       FAKE_RESOLVE_STATE            launch marker written by the "resolve" script
+#       FAKE_RESOLVE_LIBRARY          JSON file with the database/folder/project tree
+#       FAKE_RESOLVE_TIMELINES        timelines per project in the default library
+#       FAKE_RESOLVE_SEED             random seed for failure injection
+#
+#   A library JSON maps database names to folders:
+#       {"Local Database": {"projects": {"Edit": {"timelines": ["Main", "Alt"]}},
+#                           "folders": {"Shows": {"projects": {"Grade": {"timelines": 100}}}}}}
+#
+#   Failed calls return None, the same as the Resolve API.
+#
+####################################################
+
+
+import os
+import json
+import time
+import uuid
+import base64
+import random
+import tempfile
+import threading
+import functools
+from collections import Counter
+
+
+#   Globals
+VERSION_STRING = "19.0.0.0069 (fake)"
+DEFAULT_DB = "Local Database"
+DEFAULT_STATE_FILE = os.path.join(tempfile.gettempdir(), "fake_resolve_started")
+THUMB_WIDTH = 320
+THUMB_HEIGHT = 180
+PAGES = ["media", "cut", "edit", "fusion", "color", "fairlight", "deliver"]
+
+#   Smallest Baseline JPEG (1x1 grey), Written by ExportStills()
+STILL_JPG = base64.b64decode(
+    "/9j/4AAQSkZJRgABAQEASABIAAD/2wBDAP//////////////////////////////////////////////////////////////////////"
+    "////////////////wgALCAABAAEBAREA/8QAFBABAAAAAAAAAAAAAAAAAAAAAP/aAAgBAQABPxA=")
+
+
+def _parseMap(text, cast=float):
+    values = {}
+    for item in (text or "").split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            values[key.strip()] = cast(value)
+
+    return values
+
+
+#   Shared Fake State: Configuration, Call Counts and the Library
+class _FakeState(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = Counter()
+        self.importTime = time.monotonic()
+        self.reset()
+
+
+    #   Back to the Environment Configuration and a Fresh Library
+    def reset(self):
+        self.latency = float(os.environ.get("FAKE_RESOLVE_LATENCY", 0))
+        self.latencies = _parseMap(os.environ.get("FAKE_RESOLVE_LATENCIES"))
+        self.failures = _parseMap(os.environ.get("FAKE_RESOLVE_FAILURES"))
+        self.startupDelay = float(os.environ.get("FAKE_RESOLVE_STARTUP_DELAY", 0))
+        self.running = os.environ.get("FAKE_RESOLVE_RUNNING", "1") != "0"
+        self.stateFile = os.environ.get("FAKE_RESOLVE_STATE", DEFAULT_STATE_FILE)
+        self.random = random.Random(os.environ.get("FAKE_RESOLVE_SEED"))
+        self.resolve = None
+
+        libraryFile = os.environ.get("FAKE_RESOLVE_LIBRARY")
+        if libraryFile:
+            with open(libraryFile, "r") as file:
+                library = json.load(file)
+        else:
+            library = buildLibrary(timelines=int(os.environ.get("FAKE_RESOLVE_TIMELINES", 10)))
+
+        self.setLibrary(library)
+        self.calls.clear()
+
+
+    def setLibrary(self, library):
+        self.databases = {dbName: _Folder(dbName, tree, [dbName], root=True) for dbName, tree in library.items()}
+
+
+    #   Counts the Call, Waits the Injected Latency and Returns False for an Injected Failure
+    def call(self, name):
+        with self.lock:
+            self.calls[name] += 1
+            failed = self.random.random() < self.failures.get(name, 0)
+
+        delay = self.latencies.get(name, self.latency)
+        if delay:
+            time.sleep(delay)
+
+        return not failed
+
+
+    #   Launch Time of the Fake Resolve, or None if it is not Running.  The Launch Marker
+    #   Only Counts While the Process that Wrote it is Alive
+    def getLaunchTime(self):
+        try:
+            with open(self.stateFile, "r") as file:
+                pid = int(file.read().strip())
+            if _isAlive(pid):
+                return os.path.getmtime(self.stateFile)
+        except (OSError, ValueError):
+            pass
+
+        if self.running:
+            return time.time() - (time.monotonic() - self.importTime)
+
+        return None
+
+
+def _isAlive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+
+#   Counts, Delays and Fails a Fake API Method as Configured
+def _api(func):
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _state.call(name):
+            return None
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _uid(*parts):
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "fake-resolve:" + "/".join(parts))).upper()
+
+
+#   Default Library: Projects in the Root and in Nested Show Folders
+def buildLibrary(timelines=10, dbName=DEFAULT_DB):
+    def project(prefix):
+        return {"timelines": [f"{prefix}_Timeline_{index:04d}" for index in range(1, timelines + 1)]}
+
+    return {dbName: {"projects": {"Sandbox": project("Sandbox")},
+                     "folders": {"Shows": {"folders": {"ShowA": {"projects": {"ShowA_Edit": project("Edit"),
+                                                                              "ShowA_Grade": project("Grade")},
+                                                                 "folders": {"Reels": {"projects": {
+                                                                     "ShowA_Reel1": project("Reel1")}}}},
+                                                       "ShowB": {"projects": {"ShowB_Edit": project("Edit")}}}}}
+                     }}
+
+
+class _Folder(object):
+    def __init__(self, name, tree, path, root=False, parent=None):
+        self.name = "" if root else name
+        self.parent = parent
+        self.path = path
+        self.projects = {}
+        self.folders = {}
+
+        for projectName, projectData in (tree.get("projects") or {}).items():
+            self.projects[projectName] = _Project(projectName, projectData, path + [projectName])
+        for folderName, folderTree in (tree.get("folders") or {}).items():
+            self.folders[folderName] = _Folder(folderName, folderTree, path + [folderName], parent=self)
+
+
+class _Resolve(object):
+    def __init__(self):
+        self.projectManager = _ProjectManager()
+        self.page = "edit"
+
+    @_api
+    def GetVersionString(self):
+        return VERSION_STRING
+
+    @_api
+    def GetProductName(self):
+        return "DaVinci Resolve Studio"
+
+    @_api
+    def GetProjectManager(self):
+        return self.projectManager
+
+    @_api
+    def GetCurrentPage(self):
+        return self.page
+
+    @_api
+    def OpenPage(self, pageName):
+        if pageName not in PAGES:
+            return False
+        self.page = pageName
+        return True
+
+    @_api
+    def Quit(self):
+        _state.resolve = None
+        return True
+
+
+class _ProjectManager(object):
+    def __init__(self):
+        self.dbName = DEFAULT_DB if DEFAULT_DB in _state.databases else next(iter(_state.databases))
+        self.folder = _state.databases[self.dbName]
+        self.project = None
+
+    @_api
+    def GetCurrentDatabase(self):
+        return {"DbType": "Disk", "DbName": self.dbName}
+
+    @_api
+    def GetDatabaseList(self):
+        return [{"DbType": "Disk", "DbName": dbName} for dbName in _state.databases]
+
+    @_api
+    def SetCurrentDatabase(self, dbInfo):
+        dbName = dbInfo.get("DbName")
+        if dbName not in _state.databases:
+            return False
+        self.dbName = dbName
+        self.folder = _state.databases[dbName]
+        self.project = None
+        return True
+
+    @_api
+    def GetCurrentFolder(self):
+        return self.folder.name
+
+    @_api
+    def GotoRootFolder(self):
+        self.folder = _state.databases[self.dbName]
+        return True
+
+    @_api
+    def GotoParentFolder(self):
+        if self.folder.parent is None:
+            return False
+        self.folder = self.folder.parent
+        return True
+
+    @_api
+    def OpenFolder(self, folderName):
+        folder = self.folder.folders.get(folderName)
+        if not folder:
+            return False
+        self.folder = folder
+        return True
+
+    @_api
+    def GetFolderListInCurrentFolder(self):
+        return list(self.folder.folders)
+
+    @_api
+    def GetProjectListInCurrentFolder(self):
+        return list(self.folder.projects)
+
+    @_api
+    def GetCurrentProject(self):
+        return self.project
+
+    @_api
+    def LoadProject(self, projectName):
+        project = self.folder.projects.get(projectName)
+        if project:
+            self.project = project
+        return project
+
+    @_api
+    def SaveProject(self):
+        return self.project is not None
+
+    @_api
+    def CloseProject(self, project):
+        if project is not self.project:
+            return False
+        self.project = None
+        return True
+
+    @_api
+    def CreateProject(self, projectName):
+        if projectName in self.folder.projects:
+            return None
+        project = _Project(projectName, {"timelines": []}, self.folder.path + [projectName])
+        self.folder.projects[projectName] = project
+        self.project = project
+        return project
+
+
+class _Project(object):
+    def __init__(self, name, data, path):
+        self.name = name
+        self.uid = _uid(*path)
+        timelineNames = data.get("timelines", [])
+        if isinstance(timelineNames, int):
+            timelineNames = [f"Timeline {index}" for index in range(1, timelineNames + 1)]
+        self.timelines = [_Timeline(timelineName, path + [timelineName]) for timelineName in timelineNames]
+        self.currentTimeline = self.timelines[0] if self.timelines else None
+        self.mediaPool = _MediaPool(self)
+        self.gallery = _Gallery()
+
+    @_api
+    def GetName(self):
+        return self.name
+
+    @_api
+    def GetUniqueId(self):
+        return self.uid
+
+    @_api
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    @_api
+    def GetTimelineByIndex(self, index):
+        if 1 <= index <= len(self.timelines):
+            return self.timelines[index - 1]
+        return None
+
+    @_api
+    def GetCurrentTimeline(self):
+        return self.currentTimeline
+
+    @_api
+    def SetCurrentTimeline(self, timeline):
+        if timeline not in self.timelines:
+            return False
+        self.currentTimeline = timeline
+        return True
+
+    @_api
+    def GetMediaPool(self):
+        return self.mediaPool
+
+    @_api
+    def GetGallery(self):
+        return self.gallery
+
+
+class _Timeline(object):
+    def __init__(self, name, path):
+        self.name = name
+        self.uid = _uid(*path)
+        self.timecode = "01:00:00:00"
+
+    @_api
+    def GetName(self):
+        return self.name
+
+    @_api
+    def GetUniqueId(self):
+        return self.uid
+
+    @_api
+    def GetCurrentTimecode(self):
+        return self.timecode
+
+    @_api
+    def SetCurrentTimecode(self, timecode):
+        self.timecode = timecode
+        return True
+
+    @_api
+    def GetCurrentClipThumbnailImage(self):
+        data = bytes([64, 96, 128]) * (THUMB_WIDTH * THUMB_HEIGHT)
+        return {"width": THUMB_WIDTH,
+                "height": THUMB_HEIGHT,
+                "format": "RGB 8 bit",
+                "data": base64.b64encode(data).decode("ascii")
+                }
+
+    @_api
+    def GrabStill(self):
+        return _Still(self)
+
+
+class _MediaPool(object):
+    def __init__(self, project):
+        self.project = project
+        self.selected = []
+
+    @_api
+    def GetSelectedClips(self):
+        return {index: clip for index, clip in enumerate(self.selected, 1)}
+
+    #   Not in the Resolve API, Selects Timelines by Name for Testing
+    def select(self, timelineNames):
+        self.selected = [_TimelineClip(timeline) for timeline in self.project.timelines
+                         if timeline.name in timelineNames]
+
+
+class _TimelineClip(object):
+    def __init__(self, timeline):
+        self.timeline = timeline
+
+    @_api
+    def GetName(self):
+        return self.timeline.name
+
+    @_api
+    def GetClipProperty(self, propertyName=None):
+        properties = {"Type": "Timeline", "Clip Name": self.timeline.name}
+        if propertyName:
+            return properties.get(propertyName, "")
+        return properties
+
+
+class _Still(object):
+    def __init__(self, timeline):
+        self.timeline = timeline
+
+
+class _Album(object):
+    def __init__(self, name):
+        self.name = name
+        self.stills = []
+
+    @_api
+    def GetStills(self):
+        return list(self.stills)
+
+    @_api
+    def ExportStills(self, stills, folderPath, filePrefix, format):
+        if not os.path.isdir(folderPath):
+            return False
+        for index, still in enumerate(stills, 1):
+            with open(os.path.join(folderPath, f"{filePrefix}_{index}.{format}"), "wb") as file:
+                file.write(STILL_JPG)
+        return True
+
+    @_api
+    def DeleteStills(self, stills):
+        self.stills = [still for still in self.stills if still not in stills]
+        return True
+
+
+class _Gallery(object):
+    def __init__(self):
+        self.albums = [_Album("Stills 1")]
+        self.currentAlbum = self.albums[0]
+
+    @_api
+    def GetCurrentStillAlbum(self):
+        return self.currentAlbum
+
+    @_api
+    def SetCurrentStillAlbum(self, album):
+        if album not in self.albums:
+            return False
+        self.currentAlbum = album
+        return True
+
+    @_api
+    def GetGalleryStillAlbums(self):
+        return list(self.albums)
+
+    @_api
+    def GetAlbumName(self, album):
+        return album.name
+
+    @_api
+    def SetAlbumName(self, album, albumName):
+        album.name = albumName
+        return True
+
+    @_api
+    def CreateGalleryStillAlbum(self):
+        album = _Album(f"Stills {len(self.albums) + 1}")
+        self.albums.append(album)
+        return album
+
+
+_state = _FakeState()
+
+
+#   Same Entry Point as the Real Module.  Returns None Until the Fake Resolve has Started
+def scriptapp(appName):
+    _state.call("scriptapp")
+    if appName != "Resolve":
+        return None
+
+    launchTime = _state.getLaunchTime()
+    if launchTime is None or time.time() < launchTime + _state.startupDelay:
+        return None
+
+    with _state.lock:
+        if _state.resolve is None:
+            _state.resolve = _Resolve()
+
+    return _state.resolve
+
+
+#   Changes the Fake Setup.  Keyword Arguments: latency, latencies, failures, startupDelay,
+#   running, stateFile, seed and library (dict, as in FAKE_RESOLVE_LIBRARY) or timelines
+def configure(**kwargs):
+    if "library" in kwargs or "timelines" in kwargs:
+        _state.setLibrary(kwargs.pop("library", None) or buildLibrary(timelines=kwargs.pop("timelines", 10)))
+        _state.resolve = None
+    if "seed" in kwargs:
+        _state.random.seed(kwargs.pop("seed"))
+
+    for key, value in kwargs.items():
+        if not hasattr(_state, key) or key in ("lock", "calls", "random", "resolve", "databases"):
+            raise TypeError(f"Unknown fake Resolve setting: {key}")
+        setattr(_state, key, value)
+
+
+#   Restores the Environment Configuration, a Fresh Library and Zero Call Counts
+def reset():
+    _state.reset()
+
+
+#   Copy of the Call Counts by Method Name
+def getCalls():
+    return dict(_state.calls)
+
+
+def resetCalls():
+    _state.calls.clear()
+
+
+#   Marks the Fake Resolve as Launched Now, as the "resolve" Script Does
+def launch():
+    with open(_state.stateFile, "w") as file:
+        file.write(str(os.getpid()))
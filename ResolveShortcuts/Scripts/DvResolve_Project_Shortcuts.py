@@ -51,94 +51,227 @@
 import sys
 import os
 import time
+import json
+import glob
+import base64
 import re
 import subprocess
 import argparse
 
+from ResolveShortcuts_Config import (getConfigPath, loadConfig, isProfileEnabled, DEFAULT_TIMEOUTS,
+                                     THUMB_CACHE_MB, PROFILE_DIR_NAME)
+from ResolveShortcuts_ThumbCache import ThumbnailCache, THUMB_CACHE_DIR
+from ResolveShortcuts_Timing import TIMING_LOG_NAME, timedOperation, timePhase, writeRecord
+from ResolveShortcuts_History import HISTORY_DB_NAME, OpenHistory
+from ResolveShortcuts_Trace import TRACE_LOG_NAME, ApiTracer, isTraceEnabled
+from ResolveShortcuts_Profile import profiled
+
+
+#   Backoff Between Readiness Probes (seconds)
+BACKOFF_START = 0.02
+BACKOFF_MAX = 1.0
+
+#   Timeline Hint Lines in the Shortcut File
+TIMELINE_INDEX_LINE = re.compile(r"^TIMELINE_INDEX = [^\r\n]*", re.MULTILINE)
+TIMELINE_ID_LINE = re.compile(r"^TIMELINE_ID = [^\r\n]*", re.MULTILINE)
+
+#   Gallery Album Used for Fallback Thumbnail Stills, so the User's Albums are Untouched
+THUMB_ALBUM_NAME = "Prism Shortcut Thumbnails"
+THUMB_TIMEOUT = 5
+
+
+#   Calls probe() with Exponential Backoff Until it Returns a Truthy Value or the Deadline Passes
+def waitFor(probe, timeout, label, start=BACKOFF_START, maxDelay=BACKOFF_MAX):
+    deadline = time.monotonic() + timeout
+    delay = start
+
+    while True:
+        try:
+            result = probe()
+            if result:
+                return result
+
+        except Exception as e:
+            print(f"[ResolveShortcuts] Waiting for {label}: {e}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"[ResolveShortcuts] Timeout reached while waiting for {label}.")
+            return None
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, maxDelay)
+
 
 class ResolveShortcuts(object):
     def __init__(self):
         self.pluginPath = os.path.dirname(os.path.dirname(__file__))
-        self.settingsFile = os.path.join(self.pluginPath, "ResolveShortcuts_Config.txt")
+        self.settingsFile = getConfigPath(self.pluginPath)
+        self.projectCacheFile = os.path.join(self.pluginPath, "ResolveShortcuts_ProjectCache.json")
+        self.projectCache = None
+        self.currentFolders = None
+        self.currentFoldersDb = None
+        self.timelineIndexes = {}
+        self.thumbCacheMB = THUMB_CACHE_MB
+        self.thumbCache = None
         self.resolve = None
+        self.resolveExe = None
+        self.pluginVersion = ""
+        self.configData = None
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timingLogFile = os.path.join(self.pluginPath, TIMING_LOG_NAME)
+        self.timer = None
+        self.history = OpenHistory(os.path.join(self.pluginPath, HISTORY_DB_NAME))
+        self.learnTimeouts = True
+        self.traceLogFile = os.path.join(self.pluginPath, TRACE_LOG_NAME)
+        self.tracer = None
+        self.profileDir = None
+
+        self.loadSettings()
+
+
+    #   Reads the Shared Config.  Cheap to Call Before Every Operation, as the File is Only
+    #   Re-parsed when it Changed, so a Long-lived Instance Picks up Settings Changes.
+    def loadSettings(self):
+        try:
+            configData = loadConfig(self.settingsFile)
+
+        except FileNotFoundError:
+            print(f"[ResolveShortcuts] ERROR: Configuration file '{self.settingsFile}' not found.")
+            return False
+        
+        except Exception as e:
+            print(f"[ResolveShortcuts] ERROR: Config file formatting error: {e}")
+            return False
+
+        if configData == self.configData:
+            return True
+
+        self.configData = configData
 
-        self.resolveExe, dvr_script_path = self.loadSettings()
+        self.resolveExe = configData.get("resolve_exe")
+        self.pluginVersion = configData.get("current_plugin_version", "")
+        self.currScenefile = configData.get("current_project")
+        self.learnTimeouts = configData.get("learn_timeouts", "True") == "True"
+
+        self.profileDir = os.path.join(self.pluginPath, PROFILE_DIR_NAME) if isProfileEnabled(configData) else None
+
+        #   A New Tracer Applies from the Next Connection
+        if isTraceEnabled(configData) != bool(self.tracer):
+            self.tracer = ApiTracer() if isTraceEnabled(configData) else None
+            self.resolve = None
+
+        thumbCacheMB = THUMB_CACHE_MB
+        if "thumb_cache_mb" in configData:
+            try:
+                thumbCacheMB = int(configData["thumb_cache_mb"])
+            except ValueError:
+                print(f"[ResolveShortcuts] WARNING: Invalid value for thumb_cache_mb: {configData['thumb_cache_mb']}")
+
+        if thumbCacheMB != self.thumbCacheMB:
+            self.thumbCacheMB = thumbCacheMB
+            self.thumbCache = None
+
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        for key in DEFAULT_TIMEOUTS:
+            if key in configData:
+                try:
+                    self.timeouts[key] = float(configData[key])
+                except ValueError:
+                    print(f"[ResolveShortcuts] WARNING: Invalid value for {key}: {configData[key]}")
 
         # Add the Resolve API script to sys.path
-        sys.path.append(dvr_script_path)
+        dvr_script_path = configData.get("dvr_script_path")
+        if dvr_script_path and dvr_script_path not in sys.path:
+            sys.path.append(dvr_script_path)
 
+        return True
 
-    def loadSettings(self):
-        dvr_script_path = None
-        resolveEXE = None
 
-        # Reads the config file - Have to use plain text for .vbs (older plugin style) for the shortcut file.
+    #   Checks the Process Table for a Running Resolve.  Returns None if the Table cannot be Read
+    def isResolveRunning(self):
+        exeName = os.path.basename(self.resolveExe or "") or "Resolve.exe"
+
         try:
-            with open(self.settingsFile, 'r') as file:
-                lines = file.readlines()
-
-            #   Parse each Line and Extract Key-value Pairs
-            for line in lines:
-                keyValue = line.strip().split('=')
-                if len(keyValue) == 2:
-                    key = keyValue[0].strip()
-                    value = keyValue[1].strip()
-
-                    if key == 'dvr_script_path':
-                        dvr_script_path = value
-                    elif key == 'resolve_exe':
-                        resolveEXE = value
-                    elif key == "current_plugin_version":
-                        self.pluginVersion = value
-                    elif key == "current_project":
-                        self.currScenefile = value
-
-            return resolveEXE, dvr_script_path
+            if sys.platform == "win32":
+                result = subprocess.run(["tasklist", "/FI", f"IMAGENAME eq {exeName}", "/NH"],
+                                        capture_output=True,
+                                        text=True,
+                                        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                                        )
+                return exeName.lower() in result.stdout.lower()
+
+            else:
+                result = subprocess.run(["pgrep", "-x", os.path.splitext(exeName)[0]],
+                                        capture_output=True,
+                                        text=True
+                                        )
+                return result.returncode == 0
 
-        except FileNotFoundError:
-            print(f"[ResolveShortcuts] ERROR: Configuration file '{self.settingsFile}' not found.")
-            return None
-        
         except Exception as e:
-            print("[ResolveShortcuts] ERROR: Config file formatting error.")
+            print(f"[ResolveShortcuts] WARNING: Unable to check for Resolve process: {e}")
             return None
 
 
-    #   Continuously Attempt to get the Resolve Instance
-    def startResolve(self, timeout):
-        startTime = time.time()
-
-        #   Start Resolve
-        subprocess.Popen(self.resolveExe)
+    #   Connects to a Running Resolve, or Launches Resolve and Waits for it in Stages:
+    #   the Process, then the Scripting Endpoint.  Each Stage has its Own Deadline.
+    def startResolve(self, timeout=None):
+        processTimeout = timeout or self.timeouts["process_timeout"]
+        apiTimeout = timeout or self.timeouts["api_timeout"]
 
-        try:
-            #   Starts loop
-            while self.resolve is None:
+        with timePhase(self.timer, "connect"):
+            #   Reuse a Live Handle (the Resident Launcher keeps this Instance Around)
+            if self.resolve is not None:
                 try:
-                    print("[ResolveShortcuts] Loading Resolve...")
-                    self.getResolve()
-                    if self.resolve is not None:
-                        print("[ResolveShortcuts] Resolve is running.")
-                        #   Breakout once it is loaded
-                        break
+                    if self.resolve.GetVersionString():
+                        return
+                except Exception:
+                    pass
+                self.resolve = None
 
-                    time.sleep(1)
+            #   Try to Connect to an Already Running Resolve First
+            if self.connectResolve():
+                print("[ResolveShortcuts] Connected to running Resolve.")
+                return
 
+        #   Only Launch if Resolve is Not Already Running
+        with timePhase(self.timer, "launch"):
+            isRunning = self.isResolveRunning()
+            if isRunning:
+                print("[ResolveShortcuts] Resolve process found, waiting for API...")
+            else:
+                print("[ResolveShortcuts] Starting Resolve...")
+                try:
+                    subprocess.Popen(self.resolveExe)
                 except Exception as e:
-                    #   Check if Timeout Exceeded
-                    if time.time() - startTime > timeout:
-                        print("[ResolveShortcuts] Timeout reached while waiting for Resolve to initialize.")
+                    print(f"[ResolveShortcuts] ERROR: Unable to start Resolve: {e}")
+                    return
+
+                #   Stage 1: Wait for the Process (Skipped if the Process Table is Unreadable)
+                if isRunning is not None:
+                    if not waitFor(self.isResolveRunning, processTimeout, "the Resolve process"):
+                        print("[ResolveShortcuts] ERROR: Resolve process did not start.")
                         return
-                    
-                    print(f"[ResolveShortcuts] ERROR: {e}")
-                    time.sleep(1)
 
-            if self.resolve is None:
-                print("[ResolveShortcuts] ERROR: Could not initialize Resolve instance.")
-                return
-            
-        except Exception as e:
-            print("[ResolveShortcuts] ERROR:", e)
+        #   Stage 2: Probe the Scripting Endpoint
+        print("[ResolveShortcuts] Loading Resolve...")
+        with timePhase(self.timer, "api_wait"):
+            isConnected = waitFor(self.connectResolve, apiTimeout, "Resolve to initialize")
+
+        if isConnected:
+            print("[ResolveShortcuts] Resolve is running.")
+        else:
+            print("[ResolveShortcuts] ERROR: Could not initialize Resolve instance.")
+
+
+    #   Single Attempt to get the Resolve Instance
+    def connectResolve(self):
+        try:
+            self.getResolve()
+        except Exception:
+            self.resolve = None
+
+        return self.resolve
 
 
     #   Imports DVR API Script
@@ -152,221 +285,636 @@ class ResolveShortcuts(object):
 
         #   Instantiate the API
         self.resolve = dvr.scriptapp("Resolve")
+        if self.resolve and self.tracer:
+            self.resolve = self.tracer.wrap(self.resolve)
 
 
-    #   Continuously Attempt to get Current Project While it is Loading
-    def getCurrProjectLoop(self, timeout):
-        startTime = time.time()
-        currProject = None
-        try:
-            #   Starts loop
-            while currProject is None:
-                try:
-                    print("[ResolveShortcuts] Loading Project Loop...")
-                    currProject = self.pm.GetCurrentProject()
-                    if currProject is not None:
-                        print("[ResolveShortcuts] Current Project loaded.")
-                        #   Return once it is loaded
-                        return currProject
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    #   Check if timeout exceeded
-                    if time.time() - startTime > timeout:
-                        print("[ResolveShortcuts] Timeout reached while waiting for Project to initialize.")
-                        return
-                    
-                    print(f"[ResolveShortcuts] ERROR: {e}")
-                    time.sleep(1)
+    #   Stage 3: Wait for the Current Project While it is Loading
+    def getCurrProjectLoop(self, timeout=None):
+        print("[ResolveShortcuts] Loading Project...")
+        currProject = waitFor(self.pm.GetCurrentProject,
+                              timeout or self.timeouts["project_timeout"],
+                              "Project to initialize"
+                              )
 
-            if currProject is None:
-                print("[ResolveShortcuts] ERROR: Could not initialize Resolve Project.")
-                return
-            
-        except Exception as e:
-            print("[ResolveShortcuts] ERROR:", e)
+        if currProject is None:
+            print("[ResolveShortcuts] ERROR: Could not initialize Resolve Project.")
+        else:
+            print("[ResolveShortcuts] Current Project loaded.")
+
+        return currProject
+
+
+    #   Starts Counting the API Calls of an Operation if Tracing is Enabled
+    def onTimingStart(self, timer):
+        if self.tracer:
+            self.tracer.reset()
+
+
+    #   Adds the API Call Counts to a Traced Record, and Opens to the Open History,
+    #   Which the Project Load Timeouts are Learned From
+    def onTimingRecord(self, record):
+        if self.tracer:
+            report = self.tracer.report()
+            record["api_calls"] = report["api_calls"]
+            record["api_ms"] = report["api_ms"]
+
+            print(f"[ResolveShortcuts] Trace: {record['operation']} made " + "\n".join(ApiTracer.describe(report)))
+            writeRecord(self.traceLogFile, dict(report, time=record["time"], operation=record["operation"],
+                                                outcome=record["outcome"], path=record.get("path")))
+
+        if record["operation"] == "open" and record.get("project"):
+            self.history.add(record)
+
+
+    #   Project Load Timeout from the Project's Open History, or the Configured Timeout
+    def getProjectTimeout(self, dbName, projectName):
+        if not self.learnTimeouts:
+            return self.timeouts["project_timeout"]
 
+        return self.history.learnTimeout(dbName, projectName, self.timeouts["project_timeout"])
 
-    def openResolveProject(self, projectLoadPath, timeout=60):
+
+    #   A timeout Overrides the Per-Stage Deadlines from the Config, Otherwise the Project Load
+    #   Deadline is Learned from Earlier Opens of the Project.  The Timeline Index/ID
+    #   are Hints Saved in the Shortcut to Avoid Scanning Every Timeline.  Each Phase is Timed
+    #   and Logged.  Returns True if the Project (and Timeline) were Opened.
+    @profiled("open")
+    @timedOperation("open")
+    def openResolveProject(self, projectLoadPath, timeout=None, timelineIndex=None, timelineId=None, shortcutFile=None,
+                           projectId=None):
 
         print(f"[ResolveShortcuts] Opening Shortcut: {projectLoadPath}")
+        self.timer.set(path=projectLoadPath, shortcut=shortcutFile)
+
+        self.loadSettings()
 
         self.startResolve(timeout)
         if not self.resolve:
-            return
+            return False
 
-        if len(projectLoadPath) < 2:
+        parsedPath = self.parseProjectPath(projectLoadPath)
+        if not parsedPath:
             print("[ResolveShortcuts] ERROR: Invalid project path format.")
-            return
+            return False
 
-        self.pm = self.resolve.GetProjectManager()
-        currDbName = self.pm.GetCurrentDatabase()["DbName"]
+        projectDB, folders, projectName, timelineName = parsedPath
+        self.timer.set(db=projectDB, project=projectName, timeline=timelineName)
+
+        with timePhase(self.timer, "db_check"):
+            self.pm = self.resolve.GetProjectManager()
+            currDbName = self.pm.GetCurrentDatabase()["DbName"]
+
+        if currDbName != projectDB:
+            print("[ResolveShortcuts] ERROR: Incorrect Resolve Database selected")
+            return False
+
+        #   Nothing to Do if the Project is Already Open
+        currProject = self.pm.GetCurrentProject()
+        if projectId and currProject and self.getUniqueId(currProject) == projectId:
+            print(f"[ResolveShortcuts] Project {projectName} is already open.")
+            self.timer.set(already_open=True)
+
+        else:
+            try: 
+                currProjectName = currProject.GetName()
+                if currProjectName != "Untitled Project":
+                    with timePhase(self.timer, "save_current"):
+                        self.pm.SaveProject()
+            except AttributeError:
+                pass
+
+            print("[ResolveShortcuts] Loading Project...")
+            loadedProject = None
+
+            #   Resolve by Unique ID First Using the Last Known Location
+            cached = self.getCachedProject(projectId, projectDB)
+            if cached and (cached["folders"], cached["name"]) != (folders, projectName):
+                loadedProject = self.loadProjectAt(cached["folders"], cached["name"], projectId, dbName=projectDB)
+                if not loadedProject:
+                    print("[ResolveShortcuts] Cached project location is stale, using the shortcut path.")
+                    self.dropCachedProject(projectId)
+
+            #   Fall Back to the Path in the Shortcut, Still Checking the Saved ID so a Renamed or
+            #   Replaced Project with the Same Name is not Opened in its Place
+            if not loadedProject:
+                loadedProject = self.loadProjectAt(folders, projectName, projectId, dbName=projectDB)
+                if not loadedProject:
+                    return False
+
+                self.updateProjectCache(self.getUniqueId(loadedProject), projectDB, folders, projectName)
+
+            print(f"[ResolveShortcuts] Project {loadedProject.GetName()} loaded successfully.")
+
+        if timelineName:
+            print("[ResolveShortcuts] Loading Timeline")
+            projectTimeout = timeout or self.getProjectTimeout(projectDB, projectName)
+            self.timer.set(project_timeout=projectTimeout)
+
+            with timePhase(self.timer, "project_wait"):
+                project = self.getCurrProjectLoop(projectTimeout)
+            if not project:
+                self.timer.outcome = "timeout"
+                return False
+
+            with timePhase(self.timer, "timeline"):
+                timeline = self.findTimeline(project, timelineName, timelineIndex, timelineId, shortcutFile)
+                if timeline:
+                    project.SetCurrentTimeline(timeline)
+
+            if not timeline:
+                print(f"[ResolveShortcuts] ERROR: Timeline {timelineName} not found.")
+                return False
+
+            print(f"[ResolveShortcuts] Timeline {timelineName} loaded successfully.")
+
+        return True
+
+
+    #   Splits a Shortcut Path "DB\Folder\...\Project\<Timeline>" into (DB, Folders, Project Name,
+    #   Timeline Name or None).  Returns None if the Path is Invalid
+    @staticmethod
+    def parseProjectPath(projectLoadPath):
+        if len(projectLoadPath) < 2:
+            return None
 
         #   Split into DB, Path, and Optional Timeline
         match = re.match(r"^(.*?)(?:<([^<>]+)>)?$", projectLoadPath)
         if not match:
-            print("[ResolveShortcuts] ERROR: Invalid project path format.")
-            return
+            return None
 
         projectPath = match.group(1).rstrip("\\")
         timelineName = match.group(2) if match.group(2) else None
 
         path_components = projectPath.split("\\")
         if len(path_components) < 2:
-            print("[ResolveShortcuts] ERROR: Invalid project path format.")
-            return
+            return None
 
         projectDB = path_components[0]
         pathDirs = path_components[1:]
 
-        if currDbName != projectDB:
-            print("[ResolveShortcuts] ERROR: Incorrect Resolve Database selected")
-            return
-
         #   Parse Folders + Project Name
-        if len(pathDirs) == 1:
-            folderPath = ""
-            projectName = pathDirs[0]
-        else:
-            folderPath = "\\".join(pathDirs[:-1])
-            projectName = pathDirs[-1]
+        folders = [folder for folder in pathDirs[:-1] if folder.strip()]
+        projectName = pathDirs[-1]
 
-        try: 
-            currProjectName = self.pm.GetCurrentProject().GetName()
-            if currProjectName != "Untitled Project":
-                self.pm.SaveProject()
-        except AttributeError:
-            pass
+        return projectDB, folders, projectName, timelineName
 
-        print("[ResolveShortcuts] Loading Project...")
-        self.pm.GotoRootFolder()
 
-        if folderPath:
-            self.pm.GotoRootFolder()
-            for folderName in folderPath.split("\\"):
-                if folderName.strip():
-                    if not self.pm.OpenFolder(folderName):
-                        print(f"[ResolveShortcuts] ERROR: Failed to open folder: {folderName}")
-                        return
+    #   Navigates to the Folders and Loads the Project.  The Project is Only Loaded if it is
+    #   Listed in the Folder, and if a projectId is Given the Loaded Project Must Match it.
+    def loadProjectAt(self, folders, projectName, projectId=None, dbName=None):
+        with timePhase(self.timer, "navigate"):
+            route = self.navigateToFolder(folders, dbName)
+            isListed = route and self.isProjectListed(projectName)
+
+            #   The Known Folder is Only Checked by its Name, so Retry Once from the Root
+            if route == "relative" and not isListed:
+                print("[ResolveShortcuts] Project not found from the known folder, retrying from the root folder.")
+                self.setKnownFolders(None, dbName)
+                route = self.navigateToFolder(folders, dbName)
+                isListed = route and self.isProjectListed(projectName)
+
+        if not route:
+            return None
 
-        if not self.pm.LoadProject(projectName):
+        if not isListed:
+            print(f"[ResolveShortcuts] ERROR: Project {projectName} not found in folder: {'/'.join(folders) or 'root'}")
+            return None
+
+        with timePhase(self.timer, "load_project"):
+            project = self.pm.LoadProject(projectName)
+
+        if not project:
             print(f"[ResolveShortcuts] ERROR: Failed to load project: {projectName}")
-            return
-        else:
-            print(f"[ResolveShortcuts] Project {projectName} loaded successfully.")
+            return None
 
-        if timelineName:
-            print("[ResolveShortcuts] Loading Timeline")
-            project = self.getCurrProjectLoop(timeout=30)
-            timelineCount = project.GetTimelineCount()
-            for index in range(1, timelineCount + 1):
-                timeline = project.GetTimelineByIndex(index)
-                if timeline.GetName() == timelineName:
-                    project.SetCurrentTimeline(timeline)
-                    print(f"[ResolveShortcuts] Timeline {timelineName} loaded successfully.")
+        if projectId and self.getUniqueId(project) != projectId:
+            print(f"[ResolveShortcuts] WARNING: Project {projectName} does not match the saved project ID.")
+            return None
+
+        return project
+
+
+    #   One Call to Check a Project is in the Current Folder Before Paying for LoadProject
+    def isProjectListed(self, projectName):
+        return projectName in (self.pm.GetProjectListInCurrentFolder() or [])
+
+
+    #   Moves the Project Manager to the Folder List Using the Fewest Calls.  Starts from the
+    #   Last Known Folder if it is Still Current, Otherwise from the Root.  Returns the Route
+    #   Taken ("relative" or "root"), or False if a Folder could not be Opened.
+    def navigateToFolder(self, folders, dbName=None):
+        folders = list(folders)
+        current = self.getKnownFolders(dbName)
+
+        if current is not None:
+            common = 0
+            for currName, targetName in zip(current, folders):
+                if currName != targetName:
                     break
-            else:
-                print(f"[ResolveShortcuts] ERROR: Timeline {timelineName} not found.")
+                common += 1
+
+            ups = len(current) - common
+            downs = folders[common:]
+
+            #   Use the Relative Route Only if it is Shorter than Going Through the Root
+            if ups + len(downs) <= 1 + len(folders):
+                isOk = all(self.pm.GotoParentFolder() for _ in range(ups))
+                isOk = isOk and all(self.pm.OpenFolder(folderName) for folderName in downs)
+                if isOk:
+                    self.setKnownFolders(folders, dbName)
+                    return "relative"
+
+                print("[ResolveShortcuts] Relative folder navigation failed, starting from root.")
+
+        self.setKnownFolders(None, dbName)
+        self.pm.GotoRootFolder()
+
+        for folderName in folders:
+            if not self.pm.OpenFolder(folderName):
+                print(f"[ResolveShortcuts] ERROR: Failed to open folder: {folderName}")
+                return False
+
+        self.setKnownFolders(folders, dbName)
+        return "root"
+
+
+    #   Returns the Project Manager Folder List if Known and Still Current, Otherwise None.  Only
+    #   Known Within this Process, as Another Process may have Moved the Project Manager Since
+    def getKnownFolders(self, dbName=None):
+        if self.currentFolders is None or self.currentFoldersDb != dbName:
+            return None
+
+        #   One Call to Check Nothing Else has Moved the Project Manager
+        expected = self.currentFolders[-1] if self.currentFolders else ""
+        if (self.pm.GetCurrentFolder() or "") != expected:
+            self.currentFolders = None
+
+        return self.currentFolders
+
+
+    #   Remembers the Current Project Manager Folder List (None if Unknown)
+    def setKnownFolders(self, folders, dbName=None):
+        self.currentFolders = list(folders) if folders is not None else None
+        self.currentFoldersDb = dbName
 
 
-    def getProjectPath(self):
+    #   Returns the Resolve Unique ID of a Project or Timeline (Requires Resolve 18+)
+    def getUniqueId(self, item):
         try:
-            #   Get the API
-            self.getResolve()
+            return item.GetUniqueId() or None
+        except Exception:
+            return None
 
-            #   Gets the various names
-            self.pm = self.resolve.GetProjectManager()
-            self.db = self.pm.GetCurrentDatabase()
-            dbName = self.db["DbName"]
-            self.currProject = self.pm.GetCurrentProject()
-            self.currProjectName = self.currProject.GetName()
-            self.currTimeline = self.currProject.GetCurrentTimeline()
-            currentFolder = self.pm.GetCurrentFolder()
-            self.currTimelineName = None
 
-            #   Get Parent Folders Recursively
-            parentFolders = []
-            while currentFolder:
-                parentFolders.append(currentFolder)
-                self.pm.GotoParentFolder()
-                previousFolder = currentFolder
-                currentFolder = self.pm.GetCurrentFolder()
-                if currentFolder == previousFolder:
-                    break  # Reached the root folder
+    #   Loads the Cache of Project Locations
+    def loadProjectCache(self):
+        if self.projectCache is None:
+            try:
+                with open(self.projectCacheFile, "r") as file:
+                    self.projectCache = json.load(file)
+            except (OSError, ValueError):
+                self.projectCache = {}
+
+            self.projectCache.setdefault("projects", {})
+            self.projectCache.pop("lastFolder", None)
+
+        return self.projectCache
+
+
+    def saveProjectCache(self):
+        try:
+            tempFile = self.projectCacheFile + ".tmp"
+            with open(tempFile, "w") as file:
+                json.dump(self.projectCache, file, indent=1)
+            os.replace(tempFile, self.projectCacheFile)
+
+        except OSError as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to save project cache: {e}")
+
+
+    #   Returns the Last Known Location of a Project ID as {"db", "folders", "name"}
+    def getCachedProject(self, projectId, dbName):
+        if not projectId:
+            return None
+
+        cached = self.loadProjectCache()["projects"].get(projectId)
+        if cached and cached.get("db") == dbName:
+            return cached
+
+        return None
+
+
+    #   Forgets the Location of a Project ID that Turned Out to be Stale
+    def dropCachedProject(self, projectId):
+        if projectId and self.loadProjectCache()["projects"].pop(projectId, None):
+            self.saveProjectCache()
+
+
+    #   Records the Location of a Project ID in the Cache File
+    def updateProjectCache(self, projectId, dbName, folders, projectName):
+        if not projectId:
+            return
+
+        entry = {"db": dbName, "folders": list(folders), "name": projectName}
+        if self.getCachedProject(projectId, dbName) == entry:
+            return
+
+        self.loadProjectCache()["projects"][projectId] = entry
+        self.saveProjectCache()
+
+
+    #   Checks the Saved Index Hint First, and Falls Back to Scanning all Timelines by Name
+    def findTimeline(self, project, timelineName, timelineIndex=None, timelineId=None, shortcutFile=None):
+        if timelineIndex:
+            try:
+                timeline = project.GetTimelineByIndex(int(timelineIndex))
+                if timeline:
+                    if timelineId:
+                        isMatch = timeline.GetUniqueId() == timelineId
+                    else:
+                        isMatch = timeline.GetName() == timelineName
+
+                    if isMatch:
+                        if timelineId:
+                            self.timelineIndexes[timelineId] = int(timelineIndex)
+                        return timeline
+
+            except (TypeError, ValueError):
+                pass
+
+            print("[ResolveShortcuts] Timeline hint is stale, searching timelines...")
+
+        timelineCount = project.GetTimelineCount()
+        for index in range(1, timelineCount + 1):
+            timeline = project.GetTimelineByIndex(index)
+            if timeline.GetName() == timelineName:
+                #   Update the Stale or Missing Hint for the Next Open
+                if shortcutFile:
+                    self.rewriteTimelineHint(shortcutFile, index, timeline.GetUniqueId())
+                return timeline
+
+        return None
+
+
+    #   Rewrites the Timeline Hint Lines in an Existing Shortcut File
+    def rewriteTimelineHint(self, shortcutFile, timelineIndex, timelineId):
+        try:
+            with open(shortcutFile, "r", newline="") as file:
+                content = file.read()
+
+            if not TIMELINE_INDEX_LINE.search(content):
+                return False
+
+            content = TIMELINE_INDEX_LINE.sub(f"TIMELINE_INDEX = {int(timelineIndex)}", content, count=1)
+            content = TIMELINE_ID_LINE.sub(lambda m: f'TIMELINE_ID = r"{timelineId or ""}"', content, count=1)
+
+            self.writeShortcut(shortcutFile, content, newline="")
+
+            print(f"[ResolveShortcuts] Updated timeline hint in {os.path.basename(shortcutFile)}")
+            return True
+
+        except Exception as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to update timeline hint: {e}")
+            return False
+
 
-            #   Reverse the List of Sub Dirs
-            parentFolders.reverse()
+    #   Captures DB, Folders, Project and Timeline of the Current Project Without Reloading it.
+    #   timelineIndexes ({timelineId: index}) are Indexes the Caller has Already Enumerated.
+    def getProjectPath(self, timelineIndexes=None):
+        self.loadSettings()
+
+        try:
+            #   Get the API
+            with timePhase(self.timer, "connect"):
+                self.getResolve()
+
+            #   Gets the various names
+            with timePhase(self.timer, "capture"):
+                self.pm = self.resolve.GetProjectManager()
+                self.db = self.pm.GetCurrentDatabase()
+                dbName = self.db["DbName"]
+                self.currProject = self.pm.GetCurrentProject()
+                self.currProjectName = self.currProject.GetName()
+                self.currTimeline = self.currProject.GetCurrentTimeline()
+                self.currTimelineName = None
+                self.currTimelineIndex = None
+                self.currTimelineId = None
+                self.currProjectId = self.getUniqueId(self.currProject)
+
+            with timePhase(self.timer, "folders"):
+                parentFolders = self.captureFolders(dbName)
 
             #   Construct the Project Path String
-            projectPath = "\\".join(parentFolders) + "\\" + self.currProjectName
+            projectPath = "\\".join([dbName] + parentFolders + [self.currProjectName])
+            self.projectBasePath = projectPath
 
             #   Add Timeline Name if there is an Active Timeline
             if self.currTimeline:
                 self.currTimelineName = self.currTimeline.GetName()
                 projectPath += f"\\<{self.currTimelineName}>"
 
-            #   Add DB Name to Path
-            projectPath = dbName + "\\" + projectPath
-            self.projectPath = projectPath.replace("\\\\", "\\")
+                #   Index and ID Hints so the Loader can Skip the Timeline Scan
+                with timePhase(self.timer, "timeline_index"):
+                    self.currTimelineId = self.getUniqueId(self.currTimeline)
+                    if self.currTimelineId:
+                        self.currTimelineIndex = self.findTimelineIndex(self.currTimelineId, timelineIndexes)
 
-            print(f"[ResolveShortcuts] ProjectPath:  {self.projectPath}")
+            self.projectPath = projectPath
 
-            self.openResolveProject(self.projectPath)
+            #   Remember Where this Project ID Lives
+            self.updateProjectCache(self.currProjectId, dbName, parentFolders, self.currProjectName)
+
+            print(f"[ResolveShortcuts] ProjectPath:  {self.projectPath}")
 
         except Exception as e:
             print("[ResolveShortcuts] ERROR:", e)
 
 
-    def getThumbnail(self, thumbDir, thumbName):
+    #   Index of a Timeline in the Current Project.  Uses the Caller's Index, then the Index Found
+    #   by an Earlier Save (Checked with One Lookup), and Only Scans all Timelines if Neither Matches
+    def findTimelineIndex(self, timelineId, timelineIndexes=None):
+        if timelineIndexes and timelineId in timelineIndexes:
+            return timelineIndexes[timelineId]
+
+        index = self.timelineIndexes.get(timelineId)
+        if index and self.getUniqueId(self.currProject.GetTimelineByIndex(index)) == timelineId:
+            return index
+
+        for index in range(1, self.currProject.GetTimelineCount() + 1):
+            if self.getUniqueId(self.currProject.GetTimelineByIndex(index)) == timelineId:
+                self.timelineIndexes[timelineId] = index
+                return index
+
+        return None
+
+
+    #   Returns the Project Manager Folder List of the Current Project.  Always Walks up to the
+    #   Root and Navigates Back: the Known Folders are Only Checked by the Current Folder's Name,
+    #   and the User may have Moved to Another Folder with the Same Name.
+    def captureFolders(self, dbName):
+        #   Get Parent Folders Recursively
+        parentFolders = []
+        currentFolder = self.pm.GetCurrentFolder()
+        while currentFolder:
+            parentFolders.append(currentFolder)
+            self.pm.GotoParentFolder()
+            previousFolder = currentFolder
+            currentFolder = self.pm.GetCurrentFolder()
+            if currentFolder == previousFolder:
+                break  # Reached the root folder
+
+        #   Reverse the List of Sub Dirs
+        parentFolders.reverse()
+
+        #   The Walk Ends at the Root Unless it Stopped on a Repeated Name
+        self.setKnownFolders(None if currentFolder else [], dbName)
+
+        #   Put the Project Manager Back Where the User Left it
+        self.navigateToFolder(parentFolders, dbName)
+
+        return parentFolders
+
+
+    #   Captures a Thumbnail of the Current Frame.  Returns {"width", "height", "data"} with Raw RGB
+    #   Bytes if Resolve can Provide the Frame Directly, {"path"} of an Exported Still as a
+    #   Fallback, or the Exception on Failure.  The Result Carries the Cache "key", and a Cache
+    #   Hit Returns {"path", "cached"} Without Touching the Resolve UI.  The Project and Timeline
+    #   can be Passed in so a Background Capture is not Affected by a Later getProjectPath().
+    def getThumbnail(self, thumbDir, thumbName, project=None, timeline=None):
+        project = project or self.currProject
+        timeline = timeline or self.currTimeline
+        currPage = None
+
         try:
+            key = self.getThumbnailKey(project, timeline)
+            cachedPath = self.getThumbCache().get(key)
+            if cachedPath:
+                return {"path": cachedPath, "key": key, "cached": True}
+
             currPage = self.resolve.GetCurrentPage()
-            self.resolve.OpenPage("color")
-            time.sleep(1)
 
-            gallery = self.currProject.GetGallery()
-            album = gallery.GetCurrentStillAlbum()
+            #   Thumbnails are Only Available on the Color Page
+            if currPage != "color":
+                self.resolve.OpenPage("color")
+                if not waitFor(lambda: self.resolve.GetCurrentPage() == "color", THUMB_TIMEOUT, "the Color page"):
+                    return RuntimeError("Unable to open the Color page")
 
-            still = [self.currTimeline.GrabStill()]
-            album.ExportStills(still, thumbDir, thumbName, "jpg") 
-            album.DeleteStills(still)
+            result = self.getThumbnailImage(timeline)
+            if not result:
+                result = self.exportThumbnail(project, timeline, thumbDir, thumbName)
 
-            self.resolve.OpenPage(currPage)                      
+            if isinstance(result, dict):
+                result["key"] = key
 
-            return True
+            return result
 
         except Exception as e:
             return e
 
+        finally:
+            if currPage and currPage != "color":
+                try:
+                    self.resolve.OpenPage(currPage)
+                except Exception:
+                    pass
 
-    def saveProjectShortcut(self, savePath):
-        self.getProjectPath()
-        #   Gets the template .resolveShortcut from plugin folder
-        templateFile = os.path.normpath(os.path.join(self.pluginPath,
-                                                    "Scripts",
-                                                    "Template",
-                                                    "shortcutTemplate.resolveShortcut"
-                                                    )
-                                        )
+
+    #   Identifies the Current Frame by Project, Timeline and Record Timecode.  Resolve does not
+    #   Expose when a Grade or Edit Changed, so a Cached Preview can Predate a Regrade
+    def getThumbnailKey(self, project, timeline):
         try:
-            #   Read the Template File
-            with open(templateFile, 'r') as file:
-                content = file.read()
+            return ThumbnailCache.makeKey(self.getUniqueId(project),
+                                          self.getUniqueId(timeline),
+                                          timeline.GetCurrentTimecode()
+                                          )
+        except Exception:
+            return None
 
-            #   Replace the Placeholder with the Plugin Version
-            modifiedContent = content.replace("VERSION_REPLACE", self.pluginVersion)
 
-            #   Replace the Placeholder with the Project Path
-            modifiedContent = modifiedContent.replace("PROJECT_PATH_REPLACE", self.projectPath)
+    #   Preview Cache Next to the Plugin Config
+    def getThumbCache(self):
+        if self.thumbCache is None:
+            self.thumbCache = ThumbnailCache(os.path.join(self.pluginPath, THUMB_CACHE_DIR), self.thumbCacheMB)
 
-            #   Create Directory Path if Needed
-            shortcutDir = os.path.dirname(savePath)
-            if not os.path.exists(shortcutDir):
-                os.makedirs(shortcutDir, exist_ok=True)
+        return self.thumbCache
 
-            #   Save the Modified Content to the New File
-            with open(savePath, 'w') as file:
-                file.write(modifiedContent)
+
+    #   Pulls the Current Frame as Raw Bytes (Requires Resolve 18.5+)
+    def getThumbnailImage(self, timeline):
+        if not hasattr(timeline, "GetCurrentClipThumbnailImage"):
+            return None
+
+        image = waitFor(timeline.GetCurrentClipThumbnailImage, THUMB_TIMEOUT, "the clip thumbnail")
+        if not image or not image.get("data"):
+            return None
+
+        if image.get("format", "RGB 8 bit") != "RGB 8 bit":
+            print(f"[ResolveShortcuts] WARNING: Unsupported thumbnail format: {image.get('format')}")
+            return None
+
+        return {"width": int(image["width"]),
+                "height": int(image["height"]),
+                "data": base64.b64decode(image["data"])
+                }
+
+
+    #   Fallback: Grabs a Still into the Scratch Album and Exports it as JPG
+    def exportThumbnail(self, project, timeline, thumbDir, thumbName):
+        gallery = project.GetGallery()
+        prevAlbum = gallery.GetCurrentStillAlbum()
+        album = self.getScratchAlbum(gallery) or prevAlbum
+
+        try:
+            if album != prevAlbum:
+                gallery.SetCurrentStillAlbum(album)
+
+            still = [timeline.GrabStill()]
+            album.ExportStills(still, thumbDir, thumbName, "jpg") 
+            album.DeleteStills(still)
+
+        finally:
+            if album != prevAlbum:
+                gallery.SetCurrentStillAlbum(prevAlbum)
+
+        matchingFiles = glob.glob(os.path.join(thumbDir, thumbName + "_*.jpg"))
+        if not matchingFiles:
+            return FileNotFoundError("Exported still not found")
+
+        return {"path": matchingFiles[0]}
+
+
+    #   Returns the Dedicated Thumbnail Album, Creating it if Needed (None if Unsupported)
+    def getScratchAlbum(self, gallery):
+        try:
+            for album in gallery.GetGalleryStillAlbums() or []:
+                if gallery.GetAlbumName(album) == THUMB_ALBUM_NAME:
+                    return album
+
+            album = gallery.CreateGalleryStillAlbum()
+            if album:
+                gallery.SetAlbumName(album, THUMB_ALBUM_NAME)
+            return album
+
+        except Exception:
+            return None
+
+
+    #   Captures the Current Project and Writes its Shortcut.  Each Phase is Timed and Logged
+    @profiled("save")
+    @timedOperation("save")
+    def saveProjectShortcut(self, savePath):
+        self.getProjectPath()
+
+        try:
+            with timePhase(self.timer, "render"):
+                content = self.renderShortcut(self.loadTemplate(),
+                                              self.projectPath,
+                                              self.currTimelineIndex,
+                                              self.currTimelineId
+                                              )
+            with timePhase(self.timer, "write"):
+                self.writeShortcut(savePath, content)
 
             saveResult = True
 
@@ -376,8 +924,145 @@ class ResolveShortcuts(object):
         except Exception as e:
             saveResult = e
             print(f"[ResolveShortcuts] ERROR: Failed to Create Shortcut: {e}")
+
+        self.timer.outcome = "ok" if saveResult is True else "failed"
+        self.timer.set(path=getattr(self, "projectPath", None), shortcut=savePath)
         
         return self.currProjectName, self.currTimelineName, saveResult
+
+
+    #   Lists the Timelines to Batch Save as (index, timeline, name) Tuples, with the Name and ID of
+    #   the Current Project.  Uses the Timelines Selected in the Media Pool if selectedOnly and there
+    #   are Any, Otherwise all Timelines in the Project.  Returns (None, None, []) on Failure.
+    def listTimelines(self, selectedOnly=True):
+        self.loadSettings()
+
+        try:
+            self.getResolve()
+            self.pm = self.resolve.GetProjectManager()
+            self.currProject = self.pm.GetCurrentProject()
+
+            timelines = [(index, timeline, timeline.GetName()) for index, timeline in self.getTimelines(selectedOnly)]
+            return self.currProject.GetName(), self.getUniqueId(self.currProject), timelines
+
+        except Exception as e:
+            print(f"[ResolveShortcuts] ERROR: Unable to List the Timelines: {e}")
+            return None, None, []
+
+
+    #   Saves One Shortcut per Timeline from a Single Capture and Template Read.  jobs are
+    #   (index, timeline, timelineName, savePath) Tuples from listTimelines() with the Save Paths
+    #   Already Made, and projectId is the Project they were Listed From.
+    @profiled("saveall")
+    @timedOperation("saveall")
+    def saveTimelineShortcuts(self, jobs, projectId=None):
+        results = []
+        timelineIds = [self.getUniqueId(timeline) for _, timeline, _, _ in jobs]
+        self.getProjectPath({timelineId: job[0] for timelineId, job in zip(timelineIds, jobs) if timelineId})
+
+        try:
+            template = self.loadTemplate()
+            if projectId and self.currProjectId != projectId:
+                raise RuntimeError("The current project changed after the timelines were listed")
+        except Exception as e:
+            print(f"[ResolveShortcuts] ERROR: Failed to Create Shortcuts: {e}")
+            self.timer.outcome = "failed"
+            results = [(timelineName, savePath, e) for _, _, timelineName, savePath in jobs]
+            return getattr(self, "currProjectName", None), results
+
+        for (index, timeline, timelineName, savePath), timelineId in zip(jobs, timelineIds):
+            projectPath = f"{self.projectBasePath}\\<{timelineName}>"
+
+            try:
+                with timePhase(self.timer, "render"):
+                    content = self.renderShortcut(template, projectPath, index, timelineId)
+                with timePhase(self.timer, "write"):
+                    self.writeShortcut(savePath, content)
+                results.append((timelineName, savePath, True))
+                print(f"[ResolveShortcuts] Created Shortcut: {projectPath}")
+
+            except Exception as e:
+                results.append((timelineName, savePath, e))
+                print(f"[ResolveShortcuts] ERROR: Failed to Create Shortcut for {timelineName}: {e}")
+
+        self.timer.set(path=getattr(self, "projectBasePath", None), shortcuts=len(results))
+        if any(result is not True for _, _, result in results):
+            self.timer.outcome = "failed"
+
+        return getattr(self, "currProjectName", None), results
+
+
+    #   Returns (index, timeline) Tuples of the Selected Timelines, or all Timelines
+    def getTimelines(self, selectedOnly=True):
+        timelines = []
+        for index in range(1, self.currProject.GetTimelineCount() + 1):
+            timelines.append((index, self.currProject.GetTimelineByIndex(index)))
+
+        if selectedOnly:
+            try:
+                selectedClips = self.currProject.GetMediaPool().GetSelectedClips() or []
+                if isinstance(selectedClips, dict):
+                    selectedClips = selectedClips.values()
+                selectedNames = {clip.GetName() for clip in selectedClips
+                                 if clip.GetClipProperty("Type") == "Timeline"}
+            except Exception:
+                selectedNames = set()
+
+            if selectedNames:
+                timelines = [(index, timeline) for index, timeline in timelines
+                             if timeline.GetName() in selectedNames]
+
+        return timelines
+
+
+    #   Reads the Template .resolveShortcut from the Plugin Folder
+    def loadTemplate(self):
+        templateFile = os.path.normpath(os.path.join(self.pluginPath,
+                                                    "Scripts",
+                                                    "Template",
+                                                    "shortcutTemplate.resolveShortcut"
+                                                    )
+                                        )
+        with open(templateFile, 'r') as file:
+            return file.read()
+
+
+    #   Fills the Template Placeholders for One Shortcut
+    def renderShortcut(self, template, projectPath, timelineIndex=None, timelineId=None):
+        #   Replace the Placeholder with the Plugin Version
+        content = template.replace("VERSION_REPLACE", self.pluginVersion)
+
+        #   Replace the Placeholder with the Project Path
+        content = content.replace("PROJECT_PATH_REPLACE", projectPath)
+
+        #   Replace the Placeholders with the Timeline Hints
+        content = content.replace("TIMELINE_INDEX_REPLACE", str(timelineIndex))
+        content = content.replace("TIMELINE_ID_REPLACE", timelineId or "")
+
+        #   Replace the Placeholder with the Project ID
+        content = content.replace("PROJECT_ID_REPLACE", self.currProjectId or "")
+
+        return content
+
+
+    #   Writes a Temp File and Renames it over the Shortcut, so the Folder mtime Changes
+    #   (the Shortcut Catalog Rescans Folders by mtime)
+    def writeShortcut(self, savePath, content, newline=None):
+        #   Create Directory Path if Needed
+        shortcutDir = os.path.dirname(savePath)
+        if not os.path.exists(shortcutDir):
+            os.makedirs(shortcutDir, exist_ok=True)
+
+        #   Save the Modified Content to the New File
+        tempPath = f"{savePath}.{os.getpid()}.tmp"
+        try:
+            with open(tempPath, 'w', newline=newline) as file:
+                file.write(content)
+            os.replace(tempPath, savePath)
+
+        finally:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
     
 
 
@@ -388,12 +1073,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Resolve Project Shortcuts")
 
     parser.add_argument("mode",
-                        choices=["load", "save"],
-                        help="Mode: 'load' to load a Resolve project from the shortcut, or 'save' to save a shortcut to a Resolve project."
+                        choices=["load", "save", "saveall"],
+                        help=("Mode: 'load' to load a Resolve project from the shortcut, 'save' to save a shortcut to a Resolve project, "
+                              "or 'saveall' to save a shortcut for every timeline into a directory.")
                         )
     
     parser.add_argument("path", help="Path to project or file")
-    parser.add_argument("shortcutFile", help="Name of the .resolveShortcut file that called this script")
+    parser.add_argument("shortcutFile", nargs="?", default=None, help="Path of the .resolveShortcut file that called this script")
+    parser.add_argument("--timeline-index", type=int, default=None, help="Saved index hint of the shortcut timeline")
+    parser.add_argument("--timeline-id", default=None, help="Saved unique ID of the shortcut timeline")
+    parser.add_argument("--project-id", default=None, help="Saved unique ID of the shortcut project")
+    parser.add_argument("--selected", action="store_true", help="saveall: only the timelines selected in the Media Pool")
     
     args = parser.parse_args()
 
@@ -403,10 +1093,27 @@ if __name__ == "__main__":
         projectPath = args.path
         shortcutFile = args.shortcutFile
 
-        #   Calls the Open Method to load the Project in Resolve with a Timeout of 30 seconds
-        resolveShortcuts.openResolveProject(projectPath, timeout=30)
+        #   Calls the Open Method to load the Project in Resolve using the configured Timeouts
+        resolveShortcuts.openResolveProject(projectPath,
+                                            timelineIndex=args.timeline_index,
+                                            timelineId=args.timeline_id,
+                                            shortcutFile=shortcutFile,
+                                            projectId=args.project_id
+                                            )
 
     elif args.mode == "save":
         savePath = args.path
 
         resolveShortcuts.saveProjectShortcut(savePath)
+
+    elif args.mode == "saveall":
+        saveDir = args.path
+
+        projectName, projectId, timelines = resolveShortcuts.listTimelines(selectedOnly=args.selected)
+
+        jobs = []
+        for index, timeline, timelineName in timelines:
+            fileName = re.sub(r'[<>:"/\\|?*]', "_", f"{projectName}_{timelineName}")
+            jobs.append((index, timeline, timelineName, os.path.join(saveDir, fileName + ".resolveShortcut")))
+
+        resolveShortcuts.saveTimelineShortcuts(jobs, projectId)
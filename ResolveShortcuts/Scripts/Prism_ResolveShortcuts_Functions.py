@@ -50,11 +50,11 @@
 
 import os
 import sys
-import glob
 import logging
+import shutil
 import subprocess
 import tempfile
-import winreg
+import time
 import re
 
 from qtpy.QtCore import *
@@ -63,12 +63,39 @@ from qtpy.QtWidgets import *
 
 from PrismUtils.Decorators import err_catcher_plugin as err_catcher
 
+#   Only the Config module and the profile decorators load with Prism.  The other plugin
+#   modules are imported by the methods that use them.
+from ResolveShortcuts_Config import (getConfigPath, loadConfig, saveConfig, isProfileEnabled, DEFAULT_TIMEOUTS,
+                                     EXTENSION, SHORTCUTS_ENVIRO_VAR, LAUNCHER_PORT, THUMB_CACHE_MB,
+                                     PROFILE_ENV_VAR, PROFILE_DIR_NAME)
+from ResolveShortcuts_Profile import profiled, aggregated
+
 logger = logging.getLogger(__name__)
 
 
 #   Globals
-EXTENSION = ".resolveShortcut"
-SHORTCUTS_ENVIRO_VAR = "PRISM_DVR_SHORTCUTS_PATH"
+THUMB_NAME = "PrismThumbImage"
+LOADER_SCRIPTS = ["DvResolve_Project_Shortcuts.py",
+                  "ResolveShortcuts_Config.py",
+                  "ResolveShortcuts_Launcher.py",
+                  "ResolveShortcuts_ThumbCache.py",
+                  "ResolveShortcuts_Timing.py",
+                  "ResolveShortcuts_History.py",
+                  "ResolveShortcuts_Trace.py",
+                  "ResolveShortcuts_Profile.py"
+                  ]
+TIMING_SUMMARY_RECORDS = 200
+
+
+#   Carries finished background thumbnail jobs back to the Qt main thread
+class ThumbnailNotifier(QObject):
+    thumbnailCaptured = Signal(object)
+    previewSaved = Signal(object)
+
+
+#   Carries finished platform probes back to the Qt main thread
+class PlatformNotifier(QObject):
+    probed = Signal(object)
 
 
 class Prism_ResolveShortcuts_Functions(object):
@@ -77,7 +104,23 @@ class Prism_ResolveShortcuts_Functions(object):
         self.plugin = plugin
         self.shortcutsEnabled = False
         self.useIcon = False
-        self.pythonEXE = None
+        self.iconPaths = {}
+        self.iconState = None
+        self.shortcutIcon = None
+        self.useLauncher = False
+        self.launcherPort = LAUNCHER_PORT
+        self._pythonEXE = None
+        self._shortcuts = None
+        self.discovery = None
+        self.startupTimes = {}
+        self.deferredTimes = {}
+        self.apiExecutor = None
+        self.thumbNotifier = None
+        self.platform = None
+        self.platformProbe = None
+        self.platformNotifier = None
+
+        initStart = time.perf_counter()
 
         #   Get the Prism root directory
         self.prismRoot = os.environ.get("PRISM_ROOT", self.core.prismRoot)
@@ -85,22 +128,23 @@ class Prism_ResolveShortcuts_Functions(object):
             logger.warning("ERROR:  Unable to get the PrismRoot")
             return None
 
-        #   Get Python.exe (Prism version or system fallback)
-        self.pythonEXE = self.getPrismPython()
-        if not self.pythonEXE:
-            return None
-
         #   Settings File
         self.pluginLocation = os.path.dirname(os.path.dirname(__file__))
-        self.settingsFile = os.path.join(self.pluginLocation, "ResolveShortcuts_Config.txt")
+        self.settingsFile = getConfigPath(self.pluginLocation)
 
-        self.loadSettings()
+        #   Python.exe, path discovery and the Resolve API bridge are deferred until a
+        #   shortcut feature is used, so only the existing config is read here
+        phaseStart = time.perf_counter()
+        self.loadSettings(create=False)
+        self.recordTiming("settings", phaseStart)
 
         #   Callbacks
+        phaseStart = time.perf_counter()
         logger.debug("Loading callbacks")
         self.core.registerCallback("userSettings_loadUI", self.userSettings_loadUI, plugin=self)
         self.core.registerCallback("onUserSettingsSave", self.saveSettings, plugin=self)
         self.core.registerCallback("getIconPathForFileType", self.setIcon, plugin=self)
+        self.core.registerCallback("postInitialize", self.startLauncher, plugin=self)
 
         if self.core.appPlugin.pluginName == "Resolve":
             #   Add RCL menu items only in Resolve
@@ -109,16 +153,83 @@ class Prism_ResolveShortcuts_Functions(object):
             resolvePlugin = self.core.getPlugin("Resolve")
             self.core.plugins.monkeyPatch(resolvePlugin.openScene, self.openScenePatch, self, force=True)
 
-        #   Imports bridge script with the Resolve API
-        try:
-            from DvResolve_Project_Shortcuts import ResolveShortcuts
-            logger.debug("Imported ResolveShortcuts")
-            self.shortcuts = ResolveShortcuts()
+        self.recordTiming("callbacks", phaseStart)
+        self.recordTiming("total", initStart)
+        logger.debug(f"ResolveShortcuts startup:  {self.getStartupReport()}")
 
-        except Exception as e:
-            logger.warning("Failed to import ResolveShortcuts module")
-            self.core.popup("Failed to import ResolveShortcuts module")
-            return
+
+    #   Python.exe used for shortcuts and the launcher, discovered on first use
+    @property
+    def pythonEXE(self):
+        if self._pythonEXE is None:
+            self._pythonEXE = self.getDiscoveredPath("python_exe", self.getPrismPython)
+
+        return self._pythonEXE
+
+
+    #   Bridge script with the Resolve API, imported on first use
+    @property
+    def shortcuts(self):
+        if self._shortcuts is None:
+            start = time.perf_counter()
+            try:
+                from DvResolve_Project_Shortcuts import ResolveShortcuts
+                self._shortcuts = ResolveShortcuts()
+                logger.debug("Imported ResolveShortcuts")
+
+            except Exception as e:
+                logger.warning(f"Failed to import ResolveShortcuts module: {e}")
+                self.core.popup("Failed to import ResolveShortcuts module")
+                raise
+
+            self.recordTiming("loader import", start, deferred=True)
+
+        return self._shortcuts
+
+
+    #   Records how long a startup (or deferred) initialization phase took
+    def recordTiming(self, phase, start, deferred=False):
+        elapsed = time.perf_counter() - start
+        if deferred:
+            self.deferredTimes[phase] = elapsed
+            logger.debug(f"ResolveShortcuts {phase} took {elapsed * 1000:.1f} ms")
+        else:
+            self.startupTimes[phase] = elapsed
+
+
+    #   One-line summary of the startup and deferred timings
+    def getStartupReport(self):
+        times = dict(self.startupTimes)
+        total = times.pop("total", sum(times.values()))
+        phases = ", ".join(f"{phase} {secs * 1000:.1f} ms" for phase, secs in times.items())
+        report = f"Startup {total * 1000:.1f} ms ({phases})"
+
+        if self.deferredTimes:
+            deferred = ", ".join(f"{phase} {secs * 1000:.1f} ms" for phase, secs in self.deferredTimes.items())
+            report += f"    Deferred:  {deferred}"
+
+        return report
+
+
+    #   Path discovery, cached next to the config for this Prism install.  Created on first use
+    @err_catcher(name=__name__)
+    def getDiscovery(self):
+        if self.discovery is None:
+            from ResolveShortcuts_Discovery import PATH_CACHE_FILE, PathDiscovery
+
+            self.discovery = PathDiscovery(os.path.join(self.pluginLocation, PATH_CACHE_FILE), scope=self.prismRoot)
+
+        return self.discovery
+
+
+    #   Returns a cached path if its mtime is unchanged, otherwise finds it with finder() and caches it
+    @err_catcher(name=__name__)
+    def getDiscoveredPath(self, key, finder, refresh=False):
+        start = time.perf_counter()
+        path = self.getDiscovery().get(key, finder, refresh)
+        self.recordTiming(f"{key} discovery", start, deferred=True)
+
+        return path
 
 
     #   Patches the Resolve Plugin openScene() Method to Allow ResolveShortcuts Launching
@@ -138,42 +249,59 @@ class Prism_ResolveShortcuts_Functions(object):
         return True
 
 
-    #   Will use the custom icon for .resolveShortcut files if enabled
+    #   Will use the custom icon for .resolveShortcut files if enabled.  Called by Prism for
+    #   every scenefile row, so this is only a lookup in the precomputed map.
     @err_catcher(name=__name__)
+    @aggregated("setIcon")
     def setIcon(self, extension):
+        return self.iconPaths.get(extension)
+
+
+    #   Rebuilds the extension to icon map, only when use_icon or shortcuts_enabled changed
+    @err_catcher(name=__name__)
+    def updateIconCache(self):
+        iconState = (self.shortcutsEnabled, self.useIcon)
+        if iconState == self.iconState:
+            return
+
+        self.iconState = iconState
+        self.iconPaths = {}
+        self.shortcutIcon = None
+
         if self.shortcutsEnabled and self.useIcon:
-            try:
-                if extension == EXTENSION:
-                    icon = os.path.join(self.pluginLocation, "UserInterfaces", "ResolveShortcuts.ico")
-                    logger.debug("Loaded ResolveShortcut Icon")
-                    return icon
-            except FileNotFoundError:
+            iconPath = os.path.join(self.pluginLocation, "UserInterfaces", "ResolveShortcuts.ico")
+            if os.path.isfile(iconPath):
+                self.iconPaths[EXTENSION] = iconPath
+                logger.debug("Loaded ResolveShortcut Icon")
+            else:
                 logger.warning("ResolveShortcut Icon missing")
-            except Exception as e:
-                logger.warning(f"ERROR: {e}")
 
-        return None
+
+    #   Loaded shortcut QIcon, cached until the icon settings change
+    @err_catcher(name=__name__)
+    def getShortcutIcon(self):
+        if self.shortcutIcon is None and EXTENSION in self.iconPaths:
+            self.shortcutIcon = QIcon(self.iconPaths[EXTENSION])
+
+        return self.shortcutIcon
 
 
     #   Load settings from plain text file due to using .vbs (older plugin style) for the shortcut file.
     @err_catcher(name=__name__)
-    def loadSettings(self):
-        #   Parses plain text into dict
-        if os.path.isfile(self.settingsFile):
-            try:
-                self.configData = {}
-                with open(self.settingsFile, 'r') as file:
-                    for line in file:
-                        line = line.strip()
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            self.configData[key.strip()] = value.strip()
-                logger.debug("Config loaded")
-            except:
-                logger.warning("Setting file is corrupt")
-                self.makeSettings()
-        else:
+    def loadSettings(self, create=True):
+        #   Parses plain text into dict (cached until the file changes)
+        try:
+            self.configData = loadConfig(self.settingsFile)
+            logger.debug("Config loaded")
+        except FileNotFoundError:
             logger.warning(f"Settings file {self.settingsFile} not found.")
+            self.configData = {}
+        except Exception:
+            logger.warning("Setting file is corrupt")
+            self.configData = {}
+
+        #   Creating the config probes for paths, so it waits for the settings UI
+        if not self.configData and create:
             self.makeSettings()
 
         #   Sets enabled variable
@@ -192,30 +320,57 @@ class Prism_ResolveShortcuts_Functions(object):
             else:
                 self.useIcon = False
 
+        self.updateIconCache()
+
+        #   Set resident launcher variables
+        self.useLauncher = self.configData.get("use_launcher") == "True"
+        self.learnTimeouts = self.configData.get("learn_timeouts", "True") == "True"
+
+        #   Profiles of the callbacks are written while profiling is enabled
+        self.profileDir = None
+        if isProfileEnabled(self.configData):
+            self.profileDir = os.path.join(self.pluginLocation, PROFILE_DIR_NAME)
+        try:
+            self.launcherPort = int(self.configData.get("launcher_port", LAUNCHER_PORT))
+        except ValueError:
+            self.launcherPort = LAUNCHER_PORT
+
 
     #   Makes the config file using default/auto values
     @err_catcher(name=__name__)
-    def makeSettings(self):
+    def makeSettings(self, refresh=False):
         logger.warning("Creating settings file.")
+        if refresh:
+            self._pythonEXE = self.getDiscoveredPath("python_exe", self.getPrismPython, refresh=True)
+
         self.configData = {
                         "current_plugin_version": self.version,
                         "python_exe_path": self.pythonEXE,
                         "plugin_path": self.pluginLocation,
-                        "dvr_script_path": self.getResolveAPILoc(),
-                        "resolve_exe": self.getResolveLoc(),
+                        "dvr_script_path": self.getResolveAPILoc(refresh),
+                        "resolve_exe": self.getResolveLoc(refresh),
                         "shortcuts_enabled": "False",
-                        "use_icon": "True"
+                        "use_icon": "True",
+                        "use_launcher": "False",
+                        "launcher_port": str(LAUNCHER_PORT),
+                        "launch_mode": "inprocess",
+                        "thumb_cache_mb": str(THUMB_CACHE_MB),
+                        "learn_timeouts": "True",
+                        "trace_api": "False",
+                        "profile": "False"
                         }
+        for key, value in DEFAULT_TIMEOUTS.items():
+            self.configData[key] = str(value)
+
         try:
-            with open(self.settingsFile, 'w') as file:
-                for key, value in self.configData.items():
-                    value = value.replace("\\", "/")
-                    file.write(f"{key}={value}\n")
+            saveConfig(self.settingsFile, self.configData)
             logger.debug(f"Settings saved to {self.settingsFile}")
 
         except Exception as e:
             logger.warning(f"Failed to save settings to {self.settingsFile}: {e}")
 
+        self.compileLoader()
+
 
     #   Finds the path to Python included with Prism or fallback to the system Python
     @err_catcher(name=__name__)
@@ -240,37 +395,39 @@ class Prism_ResolveShortcuts_Functions(object):
             return None
 
 
-    #   Since Resolve.exe does not seem to be found in winreg, this uses common install locations
-    #   Not perfect, but the user can specify the loc in Prims Settings
+    #   Since Resolve.exe does not seem to be found in winreg, this probes the common install
+    #   locations (and PRISM_DVR_RESOLVE_EXE).  Not perfect, but the user can specify the loc in Prims Settings
     @err_catcher(name=__name__)
-    def getResolveLoc(self):
-        commonPaths = [os.path.join("C:\\", "Program Files", "Blackmagic Design", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("C:\\", "Program Files (x86)", "Blackmagic Design", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("C:\\", "Program Files", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("C:\\", "Program Files (x86)", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("D:\\", "Program Files", "Blackmagic Design", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("D:\\", "Program Files (x86)", "Blackmagic Design", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("D:\\", "Program Files", "DaVinci Resolve", "Resolve.exe"),
-                       os.path.join("E:\\", "Program Files", "DaVinci Resolve", "Resolve.exe")]
-        
-        for path in commonPaths:
-            if os.path.isfile(path):
-                return path
-            else:
-                return os.path.join("C:\\", "Program Files", "Blackmagic Design", "DaVinci Resolve", "Resolve.exe")
+    def getResolveLoc(self, refresh=False):
+        start = time.perf_counter()
+        resolveExe = self.getDiscovery().findResolveExe(refresh)
+        self.recordTiming("resolve_exe discovery", start, deferred=True)
+
+        if not resolveExe:
+            from ResolveShortcuts_Discovery import getResolveExeCandidates
+
+            logger.warning("Unable to find the Resolve executable")
+            candidates = getResolveExeCandidates()
+            resolveExe = candidates[0] if candidates else ""
+
+        return resolveExe
             
 
-    #   Uses the default Davinci install location
-    @err_catcher(name=__name__)
-    def getResolveAPILoc(self):
-        resolveAPIpath = os.path.join(os.environ["PROGRAMDATA"],
-                                      "Blackmagic Design",
-                                      "DaVinci Resolve",
-                                      "Support",
-                                      "Developer",
-                                      "Scripting",
-                                      "Modules"
-                                      )
+    #   Finds the folder with DaVinciResolveScript.py in the default Davinci install locations
+    #   (or PRISM_DVR_SCRIPT_PATH / RESOLVE_SCRIPT_API)
+    @err_catcher(name=__name__)
+    def getResolveAPILoc(self, refresh=False):
+        start = time.perf_counter()
+        resolveAPIpath = self.getDiscovery().findScriptModules(refresh)
+        self.recordTiming("dvr_script_path discovery", start, deferred=True)
+
+        if not resolveAPIpath:
+            from ResolveShortcuts_Discovery import getScriptModuleCandidates
+
+            logger.warning("Unable to find the Resolve scripting modules")
+            candidates = getScriptModuleCandidates()
+            resolveAPIpath = candidates[0] if candidates else ""
+
         return resolveAPIpath
 
 
@@ -283,22 +440,48 @@ class Prism_ResolveShortcuts_Functions(object):
                  "dvr_script_path": self.e_resolveApiScript.text(),
                  "resolve_exe": self.e_resolveEXE.text(),
                  "shortcuts_enabled": str(self.chb_enableShortcutFunctions.isChecked()),
-                 "use_icon": str(self.chb_useIcon.isChecked())
+                 "use_icon": str(self.chb_useIcon.isChecked()),
+                 "use_launcher": str(self.chb_useLauncher.isChecked()),
+                 "launcher_port": str(self.launcherPort),
+                 "launch_mode": self.configData.get("launch_mode", "inprocess"),
+                 "thumb_cache_mb": self.configData.get("thumb_cache_mb", str(THUMB_CACHE_MB)),
+                 "process_timeout": str(self.sp_processTimeout.value()),
+                 "api_timeout": str(self.sp_apiTimeout.value()),
+                 "project_timeout": str(self.sp_projectTimeout.value()),
+                 "learn_timeouts": str(self.chb_learnTimeouts.isChecked()),
+                 "trace_api": self.configData.get("trace_api", "False"),
+                 "profile": str(self.chb_profile.isChecked())
                  }
         try:
-            with open(self.settingsFile, 'w') as file:
-                for key, value in pData.items():
-                    value = value.replace("\\", "/")
-                    file.write(f"{key}={value}\n")
+            saveConfig(self.settingsFile, pData)
             logger.debug(f"Settings saved to {self.settingsFile}")
 
         except Exception as e:
             logger.warning(f"ERROR:  Failed to save settings to {self.settingsFile}: {e}")
 
+        #   Refresh the plugin state from the saved file
+        self.loadSettings()
+        self.compileLoader()
+
+
+    #   Precompiles the loader modules so shortcut launches load cached bytecode
+    @err_catcher(name=__name__)
+    def compileLoader(self):
+        import compileall
+
+        for script in LOADER_SCRIPTS:
+            scriptPath = os.path.join(self.pluginLocation, "Scripts", script)
+            if not compileall.compile_file(scriptPath, quiet=1):
+                logger.warning(f"Unable to precompile {scriptPath}")
+
 
     # #   Called with Callback
     @err_catcher(name=__name__)
+    @profiled("userSettings_loadUI")
     def userSettings_loadUI(self, origin):      #   ADDING "ResolveShortcuts" TO SETTINGS
+        from ResolveShortcuts_Timing import TIMING_LOG_NAME
+        from ResolveShortcuts_History import HISTORY_DB_NAME
+
         # Create a Widget
         origin.w_resolveShortcuts = QWidget()
         lo_resolveShortcuts = QVBoxLayout(origin.w_resolveShortcuts)
@@ -442,6 +625,36 @@ class Prism_ResolveShortcuts_Functions(object):
         lo_resolveConfig.addWidget(l_pluginLocExample)
 
 
+        lo_resolveConfig.addItem(QSpacerItem(20, 10, QSizePolicy.Minimum, QSizePolicy.Fixed))
+
+
+        # TIMEOUTS SECTION
+        lo_timeouts = QHBoxLayout()
+
+        l_timeouts = QLabel("Timeouts (seconds):")
+        lo_timeouts.addWidget(l_timeouts)
+
+        self.sp_processTimeout = QSpinBox()
+        self.sp_apiTimeout = QSpinBox()
+        self.sp_projectTimeout = QSpinBox()
+
+        for label, spinBox in (("Resolve Process:", self.sp_processTimeout),
+                               ("Scripting API:", self.sp_apiTimeout),
+                               ("Project Load:", self.sp_projectTimeout)):
+            spinBox.setRange(1, 3600)
+            lo_timeouts.addItem(QSpacerItem(20, 10, QSizePolicy.Fixed, QSizePolicy.Minimum))
+            lo_timeouts.addWidget(QLabel(label))
+            lo_timeouts.addWidget(spinBox)
+
+        lo_timeouts.addItem(QSpacerItem(20, 10, QSizePolicy.Fixed, QSizePolicy.Minimum))
+
+        self.chb_learnTimeouts = QCheckBox("Learn per project")
+        lo_timeouts.addWidget(self.chb_learnTimeouts)
+
+        lo_timeouts.addItem(QSpacerItem(20, 10, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        lo_resolveConfig.addLayout(lo_timeouts)
+
+
         lo_resolveConfig.addItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
 
 
@@ -451,6 +664,11 @@ class Prism_ResolveShortcuts_Functions(object):
         self.chb_useIcon = QCheckBox("Associate Icon with shortcut filetype")
         lo_btmBar1.addWidget(self.chb_useIcon)
 
+        lo_btmBar1.addItem(QSpacerItem(20, 20, QSizePolicy.Fixed, QSizePolicy.Minimum))
+
+        self.chb_useLauncher = QCheckBox("Use resident shortcut launcher")
+        lo_btmBar1.addWidget(self.chb_useLauncher)
+
         lo_btmBar1.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
 
         l_reset = QLabel("Reset Locations to default:  ")
@@ -469,9 +687,66 @@ class Prism_ResolveShortcuts_Functions(object):
         self.gb_resolveConfig.setLayout(lo_resolveConfig)
         lo_resolveShortcuts.addWidget(self.gb_resolveConfig)
 
+
+        # SHORTCUT TIMING SECTION
+        self.gb_timing = QGroupBox("Shortcut Timing")
+        lo_timing = QVBoxLayout(self.gb_timing)
+
+        self.tw_timing = QTableWidget(0, 7)
+        self.tw_timing.setHorizontalHeaderLabels(["Operation", "Phase", "Count", "Mean (s)", "p50 (s)", "p95 (s)", "Max (s)"])
+        self.tw_timing.verticalHeader().setVisible(False)
+        self.tw_timing.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tw_timing.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tw_timing.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tw_timing.setMinimumHeight(150)
+        lo_timing.addWidget(self.tw_timing)
+
+        lo_timingBar = QHBoxLayout()
+
+        self.l_timingRecords = QLabel()
+        self.l_timingRecords.setStyleSheet("font-size: 8pt;")
+        lo_timingBar.addWidget(self.l_timingRecords)
+
+        lo_timingBar.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+
+        self.chb_profile = QCheckBox("Write profiles")
+        lo_timingBar.addWidget(self.chb_profile)
+
+        lo_timingBar.addItem(QSpacerItem(20, 20, QSizePolicy.Fixed, QSizePolicy.Minimum))
+
+        but_refreshTiming = QPushButton("Refresh")
+        but_refreshTiming.clicked.connect(self.loadTimingSummary)
+        but_refreshTiming.clicked.connect(self.loadOpenHistory)
+        lo_timingBar.addWidget(but_refreshTiming)
+        lo_timing.addLayout(lo_timingBar)
+
+        lo_resolveShortcuts.addWidget(self.gb_timing)
+
+
+        # PROJECT OPEN HISTORY SECTION
+        self.gb_openHistory = QGroupBox("Project Open Times")
+        lo_openHistory = QVBoxLayout(self.gb_openHistory)
+
+        self.tw_openHistory = QTableWidget(0, 7)
+        self.tw_openHistory.setHorizontalHeaderLabels(["Database", "Project", "Opens", "Failed",
+                                                       "p50 (s)", "p95 (s)", "Timeout (s)"])
+        self.tw_openHistory.verticalHeader().setVisible(False)
+        self.tw_openHistory.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tw_openHistory.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tw_openHistory.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tw_openHistory.setMinimumHeight(120)
+        lo_openHistory.addWidget(self.tw_openHistory)
+
+        lo_resolveShortcuts.addWidget(self.gb_openHistory)
+
         # Add an expanding spacer at the bottom
         lo_resolveShortcuts.addItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
+        #   STARTUP TIMING
+        self.l_startupTimes = QLabel()
+        self.l_startupTimes.setStyleSheet("font-size: 8pt; color: gray;")
+        lo_resolveShortcuts.addWidget(self.l_startupTimes)
+
         #   Tooltips
         tip = "Globally enable the Resolve Shortcuts functionality."
         self.chb_enableShortcutFunctions.setToolTip(tip)
@@ -540,6 +815,58 @@ class Prism_ResolveShortcuts_Functions(object):
                "Prism must be restarted for change to be visible.")
         self.chb_useIcon.setToolTip(tip)
 
+        tip = ("Keep a resident launcher running with the Prism tray.\n"
+               "Shortcuts hand their project off to the launcher, which keeps\n"
+               "the Resolve API connection open, instead of starting a new\n"
+               "Python process for every open.\n\n"
+               "Prism must be restarted for change to take effect.")
+        self.chb_useLauncher.setToolTip(tip)
+
+        tip = ("How long a shortcut waits at each stage of opening:\n\n"
+               "Resolve Process:  for the Resolve process to start\n"
+               "Scripting API:      for Resolve's scripting API to answer\n"
+               "Project Load:       for the project to finish loading\n\n"
+               "Readiness is checked quickly at first and then less often, so\n"
+               "longer timeouts do not slow down fast opens.  Increase the\n"
+               "Project Load timeout for large or cloud database projects.")
+        for widget in (l_timeouts, self.sp_processTimeout, self.sp_apiTimeout, self.sp_projectTimeout):
+            widget.setToolTip(tip)
+
+        tip = ("Learn the Project Load timeout of each project from how long\n"
+               "its earlier opens took (about twice its slow-case load time).\n\n"
+               "The Project Load timeout above is used until a project has\n"
+               "been opened a few times, and a project that timed out gets\n"
+               "twice as long on its next open.")
+        self.chb_learnTimeouts.setToolTip(tip)
+
+        tip = ("Opens of each project from the open history:\n\n"
+               f"{os.path.join(self.pluginLocation, HISTORY_DB_NAME)}\n\n"
+               "p50 and p95 are the typical and slow-case open times, and\n"
+               "Timeout is the Project Load timeout the next open will use.")
+        self.gb_openHistory.setToolTip(tip)
+        self.tw_openHistory.setToolTip(tip)
+
+        tip = ("Time spent in each phase of opening and saving shortcuts,\n"
+               f"from the newest {TIMING_SUMMARY_RECORDS} entries of the timing log:\n\n"
+               f"{os.path.join(self.pluginLocation, TIMING_LOG_NAME)}\n\n"
+               "p50 is the typical time and p95 the slow case.  The phases\n"
+               "with the largest times are where a slow open or save waits.")
+        self.gb_timing.setToolTip(tip)
+        self.tw_timing.setToolTip(tip)
+
+        tip = ("Run shortcut opens and saves (also those made from Prism), and\n"
+               "the settings and icon callbacks, under the Python profiler.\n"
+               "Each call writes a .prof file to:\n\n"
+               f"{os.path.join(self.pluginLocation, PROFILE_DIR_NAME)}\n\n"
+               "Open them with ResolveShortcuts_Profile.py, pstats or snakeviz.\n"
+               f"Can also be enabled with the {PROFILE_ENV_VAR}=1 environment variable.\n"
+               "Profiling slows the plugin down, so only enable it to find a problem.")
+        self.chb_profile.setToolTip(tip)
+
+        tip = ("Time the plugin added to Prism's startup, and the time of the\n"
+               "setup that is deferred until a shortcut feature is first used.")
+        self.l_startupTimes.setToolTip(tip)
+
         tip = "Force regeneration of the default paths."
         l_reset.setToolTip(tip)
         but_reset.setToolTip(tip)
@@ -547,9 +874,15 @@ class Prism_ResolveShortcuts_Functions(object):
         self.loadSettings()
         self.loadValues()
         self.refreshUI()
+        self.l_startupTimes.setText(self.getStartupReport())
+        self.loadTimingSummary()
+        self.loadOpenHistory()
 
         self.chb_enableShortcutFunctions.toggled.connect(self.refreshUI)
 
+        #   Status buttons show the cached probe and update when the background probe finishes
+        self.getPlatformProbe().refresh()
+
         # Add Tab to User Settings
         origin.addTab(origin.w_resolveShortcuts, "Resolve Shortcuts")
 
@@ -571,6 +904,117 @@ class Prism_ResolveShortcuts_Functions(object):
 
         self.chb_enableShortcutFunctions.setChecked(self.shortcutsEnabled)
         self.chb_useIcon.setChecked(self.useIcon)
+        self.chb_useLauncher.setChecked(self.useLauncher)
+        self.chb_learnTimeouts.setChecked(self.learnTimeouts)
+        self.chb_profile.setChecked(self.configData.get("profile") == "True")
+
+        for key, spinBox in (("process_timeout", self.sp_processTimeout),
+                             ("api_timeout", self.sp_apiTimeout),
+                             ("project_timeout", self.sp_projectTimeout)):
+            try:
+                spinBox.setValue(int(float(self.configData.get(key, DEFAULT_TIMEOUTS[key]))))
+            except ValueError:
+                spinBox.setValue(DEFAULT_TIMEOUTS[key])
+
+
+    #   Fills the Timing Table from the Newest Records of the Loader's Timing Log
+    @err_catcher(name=__name__)
+    def loadTimingSummary(self, *args):
+        from ResolveShortcuts_Timing import TIMING_LOG_NAME, readRecords, summarize
+
+        logPath = os.path.join(self.pluginLocation, TIMING_LOG_NAME)
+        records = readRecords(logPath, limit=TIMING_SUMMARY_RECORDS)
+
+        rows = []
+        for operation, phases in summarize(records).items():
+            for phase, stats in phases.items():
+                rows.append([operation if phase == "total" else "",
+                             phase,
+                             str(stats["count"]),
+                             *[f"{stats[key] / 1000:.2f}" for key in ("mean", "p50", "p95", "max")]
+                             ])
+
+        self.tw_timing.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column >= 2:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.tw_timing.setItem(row, column, item)
+
+        failed = sum(1 for record in records if record.get("outcome") != "ok")
+        if records:
+            self.l_timingRecords.setText(f"{len(records)} operations logged ({failed} failed)")
+        else:
+            self.l_timingRecords.setText("No shortcuts opened or saved yet")
+
+
+    #   Fills the Project Table from the Loader's Open History
+    @err_catcher(name=__name__)
+    def loadOpenHistory(self, *args):
+        from ResolveShortcuts_History import HISTORY_DB_NAME, OpenHistory
+
+        historyPath = os.path.join(self.pluginLocation, HISTORY_DB_NAME)
+        stats = []
+
+        if os.path.isfile(historyPath):
+            try:
+                projectTimeout = float(self.configData.get("project_timeout", DEFAULT_TIMEOUTS["project_timeout"]))
+            except ValueError:
+                projectTimeout = DEFAULT_TIMEOUTS["project_timeout"]
+
+            try:
+                stats = OpenHistory(historyPath).getProjectStats(projectTimeout)
+            except Exception as e:
+                logger.warning(f"ERROR: Unable to read the open history: {e}")
+
+        self.tw_openHistory.setRowCount(len(stats))
+        for row, stat in enumerate(stats):
+            timeout = stat["timeout"] if self.learnTimeouts else projectTimeout
+            values = [stat["db"],
+                      stat["project"],
+                      str(stat["opens"]),
+                      str(stat["failed"]),
+                      "-" if stat["p50"] is None else f"{stat['p50'] / 1000:.2f}",
+                      "-" if stat["p95"] is None else f"{stat['p95'] / 1000:.2f}",
+                      f"{timeout:.0f}"
+                      ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column >= 2:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.tw_openHistory.setItem(row, column, item)
+
+
+    #   Starts the Resident Shortcut Launcher with the Prism Tray
+    @err_catcher(name=__name__)
+    def startLauncher(self, *args):
+        if not (self.shortcutsEnabled and self.useLauncher):
+            return
+
+        if self.core.appPlugin.pluginName != "Standalone":
+            return
+
+        from ResolveShortcuts_Launcher import isLauncherRunning
+
+        if isLauncherRunning(self.launcherPort):
+            logger.debug("ResolveShortcuts launcher already running")
+            return
+
+        launcherScript = os.path.join(self.pluginLocation, "Scripts", "ResolveShortcuts_Launcher.py")
+        command = [self.pythonEXE, launcherScript, "--port", str(self.launcherPort)]
+
+        try:
+            if sys.platform == "win32":
+                flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW
+                subprocess.Popen(command, creationflags=flags, close_fds=True)
+            else:
+                subprocess.Popen(command, start_new_session=True, close_fds=True)
+
+            logger.debug(f"Started ResolveShortcuts launcher on port {self.launcherPort}")
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Unable to start ResolveShortcuts launcher: {e}")
 
 
     #   File browser
@@ -613,11 +1057,11 @@ class Prism_ResolveShortcuts_Functions(object):
         if result == "Yes":
             logger.debug("Resetting ResolveShortcuts settings to default values.")
 
-            self.makeSettings()
+            self.makeSettings(refresh=True)
             self.loadValues()
 
 
-    #   Configures Settings UI elements
+    #   Configures Settings UI elements.  Only reads cached platform status, so never blocks
     @err_catcher(name=__name__)
     def refreshUI(self, *args):
         isEnviroVar = self.checkEnviroVar()
@@ -635,7 +1079,14 @@ class Prism_ResolveShortcuts_Functions(object):
 
         isFileAssociated = self.checkFileAssoc()
 
-        if isFileAssociated:
+        if isFileAssociated is None:
+            #   No probe has finished yet
+            self.b_setFileAssociation.show()
+            self.b_delFileAssociation.hide()
+            self.b_setFileAssociation.setEnabled(False)
+            self.b_setFileAssociation.setText("Checking...")
+            self.b_setFileAssociation.setStyleSheet("")
+        elif isFileAssociated:
             self.b_setFileAssociation.hide()
             self.b_delFileAssociation.show()
             self.b_setFileAssociation.setStyleSheet("background-color: green; color: white;")
@@ -646,100 +1097,119 @@ class Prism_ResolveShortcuts_Functions(object):
             self.b_setFileAssociation.setStyleSheet("background-color: red; color: white;")
             self.b_delFileAssociation.setStyleSheet("background-color: red; color: white;")
 
+        if isFileAssociated is not None:
+            self.b_setFileAssociation.setEnabled(True)
+            self.b_setFileAssociation.setText("Click to Set")
+
+        #   Nothing can be set or removed on platforms without a backend
+        if not self.platform.supported:
+            for button in (self.b_setFileAssociation, self.b_delFileAssociation,
+                           self.but_setEnviroVar, self.but_removeEnviroVar):
+                button.setEnabled(False)
+                button.setToolTip(f"Not supported on {self.platform.system}")
+
         enabled = self.chb_enableShortcutFunctions.isChecked()
-        self.gb_resolveConfig.setEnabled(isEnviroVar and enabled)
+        self.gb_resolveConfig.setEnabled(bool(isEnviroVar) and enabled)
+
+
+    #   Platform backend and its cached status probe, created on first use
+    def getPlatformProbe(self):
+        if self.platformProbe is None:
+            from ResolveShortcuts_Platform import getBackend, HealthProbe
+
+            self.platform = getBackend()
+            self.platformNotifier = PlatformNotifier()
+            self.platformNotifier.probed.connect(self.onPlatformProbed)
+            self.platformProbe = HealthProbe(self.platform, onUpdate=self.platformNotifier.probed.emit)
+
+        return self.platformProbe
 
 
-    #   Checks for file association
+    #   Shows a popup and returns False on platforms without a backend
+    def isPlatformSupported(self):
+        self.getPlatformProbe()
+        if self.platform.supported:
+            return True
+
+        self.core.popup(f"Shortcut setup is not supported on {self.platform.system}.")
+        return False
+
+
+    #   Runs on the main thread when a background probe finishes
+    def onPlatformProbed(self, results):
+        logger.debug(f"Platform status ({self.platform.name}): {results}")
+
+        #   The settings window may have been closed while probing
+        try:
+            self.gb_resolveConfig.isEnabled()
+        except (AttributeError, RuntimeError):
+            return
+
+        self.refreshUI()
+
+
+    #   Cached file association status.  None until the first probe finishes
     @err_catcher(name=__name__)
     def checkFileAssoc(self):
-        try:
-            #   Check what file type is associated with .resolveShortcut
-            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, ".resolveShortcut", 0, winreg.KEY_READ) as key:
-                fileType, _ = winreg.QueryValueEx(key, None)
-            
-            #   If there's no file type associated, return False
-            if not fileType:
-                return False
-            
-            #   Check what command is associated with opening that file type
-            command_key = f"{fileType}\\shell\\open\\command"
-            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, command_key, 0, winreg.KEY_READ) as key:
-                command, _ = winreg.QueryValueEx(key, None)
-            
-            return "python.exe" in command.lower()
-        
-        except FileNotFoundError:
-            return False
-        except Exception as e:
-            logger.warning(f"ERROR: checking file association: {e}")
-            return False
+        results = self.getPlatformProbe().get()
+        if results is None:
+            return None
+
+        return results["fileAssoc"]
         
 
     @err_catcher(name=__name__)
     def setShortcutFileAssociation(self):
-        try:
-            # Associate the extension with a file type (User level)
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\{EXTENSION}") as key:
-                winreg.SetValue(key, "", winreg.REG_SZ, "PythonFile")
-
-            # Set the command to open with Python (User level)
-            command = f'"{self.pythonEXE}" "%1"'
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\PythonFile\\shell\\open\\command") as key:
-                winreg.SetValue(key, "", winreg.REG_SZ, command)
+        if not self.isPlatformSupported():
+            return
 
-            logger.debug(f"Successfully associated {EXTENSION} files with Python.")
+        probe = self.getPlatformProbe()
+        if not self.pythonEXE:
+            self.core.popup("Unable to find a Python executable for the file association.")
+            return
 
-            # Tell Windows to refresh file associations (User level)
-            subprocess.run(["assoc", f"{EXTENSION}=PythonFile"], shell=True)
-            subprocess.run(["ftype", f"PythonFile={command}"], shell=True)
+        try:
+            self.platform.setFileAssoc(self.pythonEXE)
 
         except Exception as e:
             logger.warning(f"ERROR:  Unable to set file association: {e}")
 
-        self.refreshUI()
+        probe.refresh()
 
 
     @err_catcher(name=__name__)
     def removeShortcutFileAssociation(self):
-        try:
-            # Delete the file extension association (User level)
-            winreg.DeleteKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\{EXTENSION}")
-            
-            # Delete the command to open with Python (User level)
-            winreg.DeleteKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\PythonFile\\shell\\open\\command")
-            
-            # Delete the PythonFile association if no other references exist
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Classes", 0, winreg.KEY_READ) as classes_key:
-                try:
-                    winreg.OpenKey(classes_key, "PythonFile")
-                    winreg.DeleteKey(winreg.HKEY_CURRENT_USER, "Software\\Classes\\PythonFile")
-                except FileNotFoundError:
-                    pass  # No need to delete if it doesn't exist
-
-            logger.debug(f"Successfully removed {EXTENSION} file association.")
+        if not self.isPlatformSupported():
+            return
 
-            # Refresh Windows file associations
-            subprocess.run(["assoc", f"{EXTENSION}="], shell=True)
-            subprocess.run(["ftype", "PythonFile="], shell=True)
+        probe = self.getPlatformProbe()
+        try:
+            self.platform.removeFileAssoc()
 
         except FileNotFoundError:
             logger.warning(f"File association for {EXTENSION} not found.")
         except Exception as e:
             logger.warning(f"ERROR: Unable to remove file association: {e}")
 
-        self.refreshUI()
+        probe.refresh()
         
 
     #   Checks if required enviro variable exists
     @err_catcher(name=__name__)
     def checkEnviroVar(self):
-        return bool(os.environ.get(SHORTCUTS_ENVIRO_VAR))
+        results = self.getPlatformProbe().get()
+        if results is None:
+            return bool(os.environ.get(SHORTCUTS_ENVIRO_VAR))
+
+        return results["enviroVar"]
     
 
     #   Set required enviro var and exits Prism
     @err_catcher(name=__name__)
     def setEnviroVar(self):
+            if not self.isPlatformSupported():
+                return
+
             text = ("Prism will need to shutdown for the environment\n"
                     "variable to be set.  Afterwards you will need to\n"
                      "manually restart Prism.\n\n"
@@ -753,7 +1223,8 @@ class Prism_ResolveShortcuts_Functions(object):
                     self.saveSettings()
                     logger.debug(f"Setting '{SHORTCUTS_ENVIRO_VAR}' environment variable")
                     logger.debug("Prism will exit")
-                    subprocess.run(['setx', SHORTCUTS_ENVIRO_VAR, self.pluginLocation], check=True)
+                    self.getPlatformProbe()
+                    self.platform.setEnviroVar(self.pluginLocation)
                     self.core.PrismTray.exitTray()
 
                 except Exception as e:
@@ -765,6 +1236,9 @@ class Prism_ResolveShortcuts_Functions(object):
     #   Removes enviro var
     @err_catcher(name=__name__)
     def removeEnviroVar(self):
+            if not self.isPlatformSupported():
+                return
+
             text = ("Prism will need to shutdown for the environment\n"
                     "variable to be set.  Afterwards you will need to\n"
                      "manually restart Prism.\n\n"
@@ -778,7 +1252,8 @@ class Prism_ResolveShortcuts_Functions(object):
                     self.saveSettings()
                     logger.debug(f"Removing '{SHORTCUTS_ENVIRO_VAR}' environment variable")
                     logger.debug("Prism will exit")
-                    subprocess.run(['setx', SHORTCUTS_ENVIRO_VAR, ""], check=True)
+                    self.getPlatformProbe()
+                    self.platform.removeEnviroVar()
                     self.core.PrismTray.exitTray()
 
                 except Exception as e:
@@ -795,11 +1270,42 @@ class Prism_ResolveShortcuts_Functions(object):
 
         if self.shortcutsEnabled:
             shortcutAct = QAction("Save Shortcut to Resolve Project", rcmenu)
+            icon = self.getShortcutIcon()
+            if icon:
+                shortcutAct.setIcon(icon)
             shortcutAct.triggered.connect(lambda: self.saveShortcut(origin))
             rcmenu.addAction(shortcutAct)
 
+            batchAct = QAction("Save Shortcuts for All Timelines", rcmenu)
+            batchAct.setToolTip("Saves one shortcut per timeline selected in the Media Pool,\n"
+                                "or per timeline in the project if none are selected.")
+            batchAct.triggered.connect(lambda: self.saveAllShortcuts(origin))
+            rcmenu.addAction(batchAct)
+
+
+    #   Runs a Resolve API call on the single API thread and waits for it, so it never
+    #   overlaps with a background thumbnail capture
+    @err_catcher(name=__name__)
+    def runApi(self, func, *args, **kwargs):
+        return self.getApiExecutor().submit(func, *args, **kwargs).result()
+
+
+    @err_catcher(name=__name__)
+    def getApiExecutor(self):
+        if self.apiExecutor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.apiExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ResolveShortcutsAPI")
 
-    #   Builds and saves shortcut (.resolveShortcut file)
+            self.thumbNotifier = ThumbnailNotifier()
+            self.thumbNotifier.thumbnailCaptured.connect(self.onThumbnailCaptured)
+            self.thumbNotifier.previewSaved.connect(self.onPreviewSaved)
+
+        return self.apiExecutor
+
+
+    #   Builds and saves shortcut (.resolveShortcut file).  The thumbnail is captured
+    #   in the background and added to the versioninfo when it arrives.
     @err_catcher(name=__name__)
     def saveShortcut(self, origin):
         #   Get details and save path data
@@ -813,14 +1319,10 @@ class Prism_ResolveShortcuts_Functions(object):
                                                  extension=".resolveShortcut",
                                                  # location=location
                                                  )
-        preview = None
 
-        currProjName, currTimelineName, saveResult = self.shortcuts.saveProjectShortcut(savePath)
+        currProjName, currTimelineName, saveResult = self.runApi(self.shortcuts.saveProjectShortcut, savePath)
 
         if saveResult is True:
-            thumbDir = tempfile.TemporaryDirectory()
-            thumbName = "PrismThumbImage"
-
             #   Adds custom description item
             detailData = {}
             if currTimelineName:
@@ -829,42 +1331,205 @@ class Prism_ResolveShortcuts_Functions(object):
                 descriptText = f'Shortcut to   "{currProjName}"'
             detailData["description"] = descriptText
 
-            #   Get thumbnail preview from Resolve
-            thumbResult = self.shortcuts.getThumbnail(thumbDir.name, thumbName)
+            #   Saves the details to the versioninfo.json and shows the shortcut right away
+            origin.core.saveSceneInfo(savePath, detailData)
+            self.core.pb.refreshUI()
 
-            if thumbResult:
-                try:
-                    pattern = os.path.join(thumbDir.name, thumbName + "_*.jpg")
-                    matching_files = glob.glob(pattern)
-
-                    if matching_files:
-                        thumbNail = matching_files[0]
-                        pixMap = self.core.media.getPixmapFromPath(thumbNail)
-                        preview = self.core.media.scalePixmap(pixMap,
-                                                            self.core.scenePreviewWidth,
-                                                            self.core.scenePreviewHeight,
-                                                            fitIntoBounds=False,
-                                                            crop=True
-                                                            )
-                    fullResult = (f"Saved shortcut to '{currProjName}'\n"
-                                  "with thumbnail.")
-                except:
-                    fullResult = (f"Saved shortcut to '{currProjName}'\n"
-                                  "without thumbnail.")
-            else:
-                fullResult = (f"Saved shortcut to '{currProjName}'\n"
-                              "without thumbnail.")
+            #   Get thumbnail preview from Resolve in the background
+            job = {"savePath": savePath,
+                   "detailData": detailData,
+                   "origin": origin,
+                   "thumbDir": tempfile.mkdtemp(prefix="ResolveShortcuts_"),
+                   "result": None
+                   }
 
-            #   Saves the details to the versioninfo.json
-            origin.core.saveSceneInfo(savePath, detailData, preview=preview)
-            
-            #   Refreshes the ProjectBrowser
-            # origin.refreshScenefiles()
-            self.core.pb.refreshUI()
+            try:
+                future = self.getApiExecutor().submit(self.shortcuts.getThumbnail,
+                                                      job["thumbDir"],
+                                                      THUMB_NAME,
+                                                      self.shortcuts.currProject,
+                                                      self.shortcuts.currTimeline
+                                                      )
+                future.add_done_callback(lambda f: self.onThumbnailDone(job, f))
+
+            except Exception:
+                shutil.rmtree(job["thumbDir"], ignore_errors=True)
+                raise
+
+            fullResult = (f"Saved shortcut to '{currProjName}'.\n"
+                          "The thumbnail will be added when it is captured.")
 
-            
         else:
             fullResult = f"Failed to save shortcut to {currProjName}:\n\n{saveResult}"
 
         logger.debug(fullResult)
         self.core.popup(fullResult, parent=self.originBrowser)
+
+
+    #   Runs on the API thread, hands the job over to the Qt main thread
+    def onThumbnailDone(self, job, future):
+        try:
+            job["result"] = future.result()
+        except Exception as e:
+            job["result"] = e
+
+        self.thumbNotifier.thumbnailCaptured.emit(job)
+
+
+    #   Runs on the Qt main thread: builds the preview and attaches it to the shortcut
+    @err_catcher(name=__name__)
+    def onThumbnailCaptured(self, job):
+        thumbDir = job["thumbDir"]
+        preview = None
+
+        try:
+            result = job["result"]
+            if isinstance(result, dict) and "data" in result:
+                #   Raw RGB frame from Resolve, built in memory
+                image = QImage(result["data"],
+                               result["width"],
+                               result["height"],
+                               result["width"] * 3,
+                               QImage.Format_RGB888
+                               ).copy()
+                pixMap = QPixmap.fromImage(image)
+
+            elif isinstance(result, dict) and "path" in result:
+                pixMap = self.loadScaledPixmap(result["path"],
+                                               self.core.scenePreviewWidth,
+                                               self.core.scenePreviewHeight
+                                               )
+
+            else:
+                pixMap = None
+                logger.debug(f"Thumbnail capture failed: {result}")
+
+            if pixMap:
+                preview = self.core.media.scalePixmap(pixMap,
+                                                      self.core.scenePreviewWidth,
+                                                      self.core.scenePreviewHeight,
+                                                      fitIntoBounds=False,
+                                                      crop=True
+                                                      )
+
+                #   Keep the finished preview for later shortcuts to the same frame
+                if not result.get("cached") and result.get("key"):
+                    previewFile = os.path.join(thumbDir, "PrismPreview.jpg")
+                    if preview.save(previewFile, "JPG"):
+                        self.shortcuts.getThumbCache().put(result["key"], previewFile)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Unable to load shortcut thumbnail: {e}")
+
+        finally:
+            shutil.rmtree(thumbDir, ignore_errors=True)
+
+        if preview is None:
+            logger.debug(f"Saved shortcut without thumbnail: {job['savePath']}")
+            return
+
+        job["origin"].core.saveSceneInfo(job["savePath"], job["detailData"], preview=preview)
+        logger.debug(f"Added thumbnail to shortcut: {job['savePath']}")
+
+        self.thumbNotifier.previewSaved.emit(job)
+
+
+    #   Runs on the Qt main thread: refreshes the Project Browser scene list to show the new preview
+    @err_catcher(name=__name__)
+    def onPreviewSaved(self, job):
+        try:
+            job["origin"].refreshScenefiles()
+        except Exception:
+            self.core.pb.refreshUI()
+
+
+    #   Decodes an image file straight to just over the target size (the crop fills the rest),
+    #   so large stills are never decoded at full resolution
+    @err_catcher(name=__name__)
+    def loadScaledPixmap(self, imagePath, width, height):
+        reader = QImageReader(imagePath)
+        sourceSize = reader.size()
+
+        if sourceSize.isValid() and sourceSize.width() > 0 and sourceSize.height() > 0:
+            scale = max(width / sourceSize.width(), height / sourceSize.height())
+            if scale < 1:
+                reader.setScaledSize(QSize(max(1, round(sourceSize.width() * scale)),
+                                           max(1, round(sourceSize.height() * scale))
+                                           ))
+
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"ERROR:  Unable to read image {imagePath}: {reader.errorString()}")
+            return None
+
+        return QPixmap.fromImage(image)
+
+
+    #   Creates an empty file at the save path so Prism counts its version as taken
+    @err_catcher(name=__name__)
+    def reserveSavePath(self, savePath):
+        os.makedirs(os.path.dirname(savePath), exist_ok=True)
+        open(savePath, "a").close()
+
+
+    #   Removes a reserved save path if nothing was written to it
+    @err_catcher(name=__name__)
+    def releaseSavePath(self, savePath):
+        try:
+            if savePath and os.path.getsize(savePath) == 0:
+                os.remove(savePath)
+        except OSError:
+            pass
+
+
+    #   Builds and saves one shortcut per timeline into the current task
+    @err_catcher(name=__name__)
+    def saveAllShortcuts(self, origin):
+        entity = origin.getCurrentEntity()
+        curDep = origin.getCurrentDepartment()
+        curTask = origin.getCurrentTask()
+
+        currProjName, projectId, timelines = self.runApi(self.shortcuts.listTimelines)
+        if currProjName is None:
+            self.core.popup("Unable to read the timelines from Resolve.", parent=self.originBrowser)
+            return
+
+        #   Save paths are made here on the main thread, as Prism core is not thread-safe.  Each
+        #   path is reserved with an empty file so the next one gets the next version.
+        jobs = []
+        for index, timeline, timelineName in timelines:
+            savePath = origin.core.generateScenePath(entity=entity,
+                                                     department=curDep,
+                                                     task=curTask,
+                                                     comment=None,
+                                                     extension=".resolveShortcut",
+                                                     )
+            self.reserveSavePath(savePath)
+            jobs.append((index, timeline, timelineName, savePath))
+
+        currProjName, results = self.runApi(self.shortcuts.saveTimelineShortcuts, jobs, projectId)
+
+        saved = [(timelineName, savePath) for timelineName, savePath, result in results if result is True]
+        failed = [(timelineName, result) for timelineName, savePath, result in results if result is not True]
+
+        #   Drops the reservations of shortcuts that were not written
+        for timelineName, savePath, result in results:
+            if result is not True:
+                self.releaseSavePath(savePath)
+
+        #   Adds custom description items
+        for timelineName, savePath in saved:
+            detailData = {"description": f'Shortcut to   "{currProjName}:   < {timelineName} >"'}
+            origin.core.saveSceneInfo(savePath, detailData)
+
+        if saved:
+            self.core.pb.refreshUI()
+
+        fullResult = f"Saved {len(saved)} shortcuts to '{currProjName}'."
+        if failed:
+            fullResult += "\n\nFailed:\n" + "\n".join(f"{name}:  {result}" for name, result in failed)
+        elif not results:
+            fullResult = f"No timelines found in '{currProjName}'."
+
+        logger.debug(fullResult)
+        self.core.popup(fullResult, parent=self.originBrowser)
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Catalog of the shortcut files in a Prism project, to find which shortcuts
+#   point at a Resolve project or timeline.  Folders are scanned in parallel
+#   with os.scandir and the PROJECT_PATH/PROJECT_ID/TIMELINE_* lines are read
+#   from the head of each shortcut without running it.  Entries are kept in a
+#   SQLite index with each folder's mtime and subfolders, so a rescan only
+#   stats the unchanged folders and re-reads the folders that changed.
+#
+#   From the command line:
+#       python ResolveShortcuts_Catalog.py scan "P:/Projects/ShowA"
+#       python ResolveShortcuts_Catalog.py query --project ShowA_Edit --timeline Main
+#
+####################################################
+
+
+import os
+import re
+import json
+import sqlite3
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from ResolveShortcuts_Config import EXTENSION
+from DvResolve_Project_Shortcuts import ResolveShortcuts
+
+
+#   Globals
+CATALOG_DB_NAME = "ResolveShortcuts_Catalog.db"
+CATALOG_WORKERS = 8
+HEADER_BYTES = 4096                 #   The header lines are at the top of every shortcut
+SKIP_DIRS = {"__pycache__"}
+
+HEADER_LINE = re.compile(r'^(PROJECT_PATH|PROJECT_ID|TIMELINE_INDEX|TIMELINE_ID) = (?:r?"([^"\r\n]*)"|(\w+))',
+                         re.MULTILINE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    root TEXT,
+    mtime_ns INTEGER,
+    subdirs TEXT
+);
+CREATE INDEX IF NOT EXISTS dirs_root ON dirs (root);
+CREATE TABLE IF NOT EXISTS shortcuts (
+    path TEXT PRIMARY KEY,
+    dir TEXT,
+    root TEXT,
+    mtime_ns INTEGER,
+    size INTEGER,
+    project_path TEXT,
+    db TEXT,
+    folders TEXT,
+    project TEXT,
+    timeline TEXT,
+    project_id TEXT,
+    timeline_id TEXT,
+    timeline_index INTEGER
+);
+CREATE INDEX IF NOT EXISTS shortcuts_project ON shortcuts (db, project, timeline);
+CREATE INDEX IF NOT EXISTS shortcuts_project_id ON shortcuts (project_id);
+CREATE INDEX IF NOT EXISTS shortcuts_dir ON shortcuts (dir);
+"""
+
+COLUMNS = ("path", "dir", "root", "mtime_ns", "size", "project_path", "db", "folders", "project", "timeline",
+           "project_id", "timeline_id", "timeline_index")
+
+
+#   Reads the Shortcut Header Lines.  Returns a Dict of the Parsed Path and Hints, or None
+#   if the File has no PROJECT_PATH
+def readShortcutHeader(filePath):
+    with open(filePath, "r", encoding="utf-8", errors="replace") as file:
+        head = file.read(HEADER_BYTES)
+
+    values = {}
+    for key, quoted, bare in HEADER_LINE.findall(head):
+        values.setdefault(key, quoted if quoted or not bare else bare)
+
+    projectPath = values.get("PROJECT_PATH")
+    parsedPath = ResolveShortcuts.parseProjectPath(projectPath) if projectPath else None
+    if not parsedPath:
+        return None
+
+    projectDB, folders, projectName, timelineName = parsedPath
+    try:
+        timelineIndex = int(values.get("TIMELINE_INDEX"))
+    except (TypeError, ValueError):
+        timelineIndex = None
+
+    return {"project_path": projectPath,
+            "db": projectDB,
+            "folders": "\\".join(folders),
+            "project": projectName,
+            "timeline": timelineName,
+            "project_id": values.get("PROJECT_ID") or None,
+            "timeline_id": values.get("TIMELINE_ID") or None,
+            "timeline_index": timelineIndex
+            }
+
+
+#   Scans One Folder.  An Unchanged Folder is Only Stat'ed and Returns its Stored Subfolders.
+#   Returns (status, mtime_ns, subdirs, entries) with status "same", "changed" or "gone"
+def scanDir(dirPath, cachedDir, knownFiles):
+    try:
+        mtime = os.stat(dirPath).st_mtime_ns
+    except OSError:
+        return "gone", None, [], []
+
+    if cachedDir and cachedDir[0] == mtime:
+        return "same", mtime, cachedDir[1], []
+
+    subdirs = []
+    entries = []
+    try:
+        with os.scandir(dirPath) as scan:
+            for entry in scan:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                            subdirs.append(entry.name)
+
+                    elif entry.name.endswith(EXTENSION) and entry.is_file():
+                        stat = entry.stat()
+                        known = knownFiles.get(entry.path)
+
+                        #   None Keeps the Indexed Entry of an Unchanged File
+                        if known and known == (stat.st_mtime_ns, stat.st_size):
+                            entries.append((entry.path, stat, None))
+                        else:
+                            entries.append((entry.path, stat, readShortcutHeader(entry.path) or {}))
+
+                except OSError as e:
+                    print(f"[ResolveShortcuts] WARNING: Unable to read {entry.path}: {e}")
+
+    except OSError:
+        return "gone", None, [], []
+
+    return "changed", mtime, sorted(subdirs), entries
+
+
+class ShortcutCatalog(object):
+    def __init__(self, dbPath, workers=CATALOG_WORKERS):
+        self.dbPath = dbPath
+        self.workers = workers
+        self.isReady = False
+
+
+    @contextlib.contextmanager
+    def connect(self):
+        conn = sqlite3.connect(self.dbPath, timeout=10)
+        try:
+            if not self.isReady:
+                conn.executescript(SCHEMA)
+                self.isReady = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+    #   Scans the Folder Tree Under root and Updates the Index.  Folders whose mtime is Unchanged
+    #   are Skipped Unless full is True.  Returns Counts of the Scan
+    def scan(self, root, full=False):
+        root = os.path.normpath(os.path.abspath(root))
+
+        with self.connect() as conn:
+            cachedDirs = {path: (mtime, json.loads(subdirs)) for path, mtime, subdirs in
+                          conn.execute("SELECT path, mtime_ns, subdirs FROM dirs WHERE root = ?", (root,))}
+            knownFiles = {}
+            for path, directory, mtime, size in conn.execute("SELECT path, dir, mtime_ns, size FROM shortcuts"
+                                                             " WHERE root = ?", (root,)):
+                knownFiles.setdefault(directory, {})[path] = (mtime, size)
+
+        counts = {"dirs": 0, "changed_dirs": 0, "shortcuts_read": 0, "shortcuts_removed": 0}
+        visited = set()
+        dirRows = []
+
+        with self.connect() as conn, ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def submit(dirPath):
+                visited.add(dirPath)
+                cachedDir = None if full else cachedDirs.get(dirPath)
+                return executor.submit(scanDir, dirPath, cachedDir, knownFiles.get(dirPath, {}))
+
+            pending = {submit(root): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dirPath = pending.pop(future)
+                    status, mtime, subdirs, entries = future.result()
+                    if status == "gone":
+                        continue
+
+                    counts["dirs"] += 1
+                    for name in subdirs:
+                        pending[submit(os.path.join(dirPath, name))] = os.path.join(dirPath, name)
+
+                    if status == "same":
+                        continue
+
+                    counts["changed_dirs"] += 1
+                    dirRows.append((dirPath, root, mtime, json.dumps(subdirs)))
+                    counts["shortcuts_removed"] += self.updateDir(conn, root, dirPath, entries)
+                    counts["shortcuts_read"] += sum(1 for entry in entries if entry[2] is not None)
+
+            #   Folders that are Gone, and their Shortcuts
+            removed = [path for path in cachedDirs if path not in visited]
+            removed += [path for path in knownFiles if path not in visited and path not in cachedDirs]
+            for dirPath in removed:
+                counts["shortcuts_removed"] += conn.execute("DELETE FROM shortcuts WHERE dir = ?", (dirPath,)).rowcount
+                conn.execute("DELETE FROM dirs WHERE path = ?", (dirPath,))
+
+            conn.executemany("INSERT OR REPLACE INTO dirs (path, root, mtime_ns, subdirs) VALUES (?, ?, ?, ?)", dirRows)
+
+        counts["shortcuts"] = self.count(root)
+        return counts
+
+
+    #   Replaces the Indexed Shortcuts of a Changed Folder.  Returns the Number Removed
+    def updateDir(self, conn, root, dirPath, entries):
+        paths = {entry[0] for entry in entries}
+        indexed = [row[0] for row in conn.execute("SELECT path FROM shortcuts WHERE dir = ?", (dirPath,))]
+        gone = [(path,) for path in indexed if path not in paths]
+        conn.executemany("DELETE FROM shortcuts WHERE path = ?", gone)
+
+        rows = []
+        for path, stat, header in entries:
+            if header is None:
+                continue
+
+            rows.append((path, dirPath, root, stat.st_mtime_ns, stat.st_size, header.get("project_path"),
+                         header.get("db"), header.get("folders"), header.get("project"), header.get("timeline"),
+                         header.get("project_id"), header.get("timeline_id"), header.get("timeline_index")))
+
+        conn.executemany(f"INSERT OR REPLACE INTO shortcuts ({', '.join(COLUMNS)})"
+                         f" VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+
+        return len(gone)
+
+
+    def count(self, root=None):
+        with self.connect() as conn:
+            if root:
+                return conn.execute("SELECT COUNT(*) FROM shortcuts WHERE root = ?",
+                                    (os.path.normpath(os.path.abspath(root)),)).fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM shortcuts").fetchone()[0]
+
+
+    #   Yields Indexed Shortcuts as Dicts, Read from the Index as they are Consumed.  Filters
+    #   Match Exactly; Shortcuts without a PROJECT_PATH have db/project None
+    def iterShortcuts(self, db=None, project=None, timeline=None, projectId=None, timelineId=None, root=None):
+        filters = {"db": db,
+                   "project": project,
+                   "timeline": timeline,
+                   "project_id": projectId,
+                   "timeline_id": timelineId,
+                   "root": os.path.normpath(os.path.abspath(root)) if root else None
+                   }
+        where = [(f"{column} = ?", value) for column, value in filters.items() if value is not None]
+
+        query = f"SELECT {', '.join(COLUMNS)} FROM shortcuts"
+        if where:
+            query += " WHERE " + " AND ".join(clause for clause, _ in where)
+        query += " ORDER BY path"
+
+        with self.connect() as conn:
+            for row in conn.execute(query, [value for _, value in where]):
+                yield dict(zip(COLUMNS, row))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index and query the shortcut files of a Prism project")
+    parser.add_argument("--catalog", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                          CATALOG_DB_NAME),
+                        help="Catalog database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scanParser = commands.add_parser("scan", help="Scan a folder tree and update the catalog")
+    scanParser.add_argument("root", help="Prism project folder")
+    scanParser.add_argument("--full", action="store_true", help="Re-read every folder, not only the changed ones")
+    scanParser.add_argument("--workers", type=int, default=CATALOG_WORKERS)
+
+    queryParser = commands.add_parser("query", help="List the shortcuts to a Resolve project or timeline")
+    queryParser.add_argument("--db", default=None, help="Resolve database name")
+    queryParser.add_argument("--project", default=None, help="Resolve project name")
+    queryParser.add_argument("--timeline", default=None, help="Timeline name")
+    queryParser.add_argument("--project-id", default=None, help="Resolve project unique ID")
+    queryParser.add_argument("--root", default=None, help="Only shortcuts scanned under this folder")
+    queryParser.add_argument("--json", action="store_true", help="One JSON object per line")
+    args = parser.parse_args()
+
+    catalog = ShortcutCatalog(args.catalog)
+
+    if args.command == "scan":
+        import time
+
+        catalog.workers = args.workers
+        start = time.perf_counter()
+        counts = catalog.scan(args.root, full=args.full)
+        print(f"Scanned {counts['dirs']} folders ({counts['changed_dirs']} changed) in {time.perf_counter() - start:.2f}s: "
+              f"{counts['shortcuts_read']} shortcuts read, {counts['shortcuts_removed']} removed, "
+              f"{counts['shortcuts']} indexed")
+
+    else:
+        for entry in catalog.iterShortcuts(db=args.db, project=args.project, timeline=args.timeline,
+                                           projectId=args.project_id, root=args.root):
+            if args.json:
+                print(json.dumps(entry))
+            else:
+                print(f"{entry['path']}\n    {entry['project_path']}")
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Reads and writes the plain text "key=value" config file shared by the
+#   Prism plugin, the shortcut loader and the shortcut files.  Parsed files
+#   are cached in-process by mtime and size, and saves go through a temp file
+#   and rename so a shortcut never reads a half-written config.
+#
+####################################################
+
+
+import os
+import threading
+
+
+#   Globals
+CONFIG_FILE_NAME = "ResolveShortcuts_Config.txt"
+
+#   Default Deadlines (seconds) for each Readiness Stage of Opening a Shortcut
+DEFAULT_TIMEOUTS = {"process_timeout": 30,
+                    "api_timeout": 60,
+                    "project_timeout": 60
+                    }
+
+#   Names and Defaults the Prism Plugin Needs at Startup, Kept Here so it does not
+#   Import the Launcher, Platform or Profile Modules Until They are Used
+EXTENSION = ".resolveShortcut"
+SHORTCUTS_ENVIRO_VAR = "PRISM_DVR_SHORTCUTS_PATH"
+LAUNCHER_PORT = 47613
+THUMB_CACHE_MB = 100
+PROFILE_ENV_VAR = "RESOLVE_SHORTCUTS_PROFILE"
+PROFILE_DIR_NAME = "Profiles"
+
+_cache = {}
+_cacheLock = threading.Lock()
+
+
+#   Path of the Config File in a Plugin Directory
+def getConfigPath(pluginPath):
+    return os.path.join(pluginPath, CONFIG_FILE_NAME)
+
+
+#   True if Profiling is Enabled by the Environment or the Config
+def isProfileEnabled(configData=None):
+    if os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return True
+
+    return (configData or {}).get("profile") == "True"
+
+
+#   Parses "key=value" Lines.  Only the First "=" Splits, so Values may Contain "="
+def parseConfig(text):
+    configData = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if "=" in line:
+            key, value = line.split("=", 1)
+            configData[key.strip()] = value.strip()
+
+    return configData
+
+
+#   Returns a Copy of the Parsed Config.  Only Re-reads the File if its mtime or Size Changed.
+#   Raises FileNotFoundError if there is no Config
+def loadConfig(configPath):
+    stat = os.stat(configPath)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _cacheLock:
+        cached = _cache.get(configPath)
+        if cached and cached[0] == stamp:
+            return dict(cached[1])
+
+    with open(configPath, "r") as file:
+        configData = parseConfig(file.read())
+
+    with _cacheLock:
+        _cache[configPath] = (stamp, configData)
+
+    return dict(configData)
+
+
+#   Writes the Config to a Temp File and Renames it over the Old One
+def saveConfig(configPath, configData):
+    tempPath = f"{configPath}.{os.getpid()}.tmp"
+
+    try:
+        with open(tempPath, "w") as file:
+            for key, value in configData.items():
+                value = str(value).replace("\\", "/")
+                file.write(f"{key}={value}\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tempPath, configPath)
+
+    finally:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+
+    with _cacheLock:
+        _cache.pop(configPath, None)
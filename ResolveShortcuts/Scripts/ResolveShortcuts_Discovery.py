@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Finds the DaVinci Resolve executable and the Resolve scripting module
+#   folder (DaVinciResolveScript.py).  Candidate locations for the platform,
+#   and any environment overrides, are probed concurrently and validated.
+#   Found paths are cached in a JSON file with their mtimes, so later starts
+#   only stat the cached path instead of probing every candidate.
+#
+####################################################
+
+
+import os
+import json
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+#   Globals
+PATH_CACHE_FILE = "ResolveShortcuts_PathCache.json"
+RESOLVE_SCRIPT_MODULE = "DaVinciResolveScript.py"
+
+#   Environment Overrides, Checked Before the Default Locations
+RESOLVE_EXE_VAR = "PRISM_DVR_RESOLVE_EXE"
+SCRIPT_PATH_VAR = "PRISM_DVR_SCRIPT_PATH"
+RESOLVE_API_VAR = "RESOLVE_SCRIPT_API"          #   Set by Resolve's own scripting setup
+
+MAX_PROBE_WORKERS = 8
+
+
+#   Resolve Executable Candidates in Priority Order
+def getResolveExeCandidates(system=None):
+    system = system or platform.system()
+    candidates = []
+
+    if os.environ.get(RESOLVE_EXE_VAR):
+        candidates.append(os.environ[RESOLVE_EXE_VAR])
+
+    if system == "Windows":
+        for drive in ("C:\\", "D:\\", "E:\\"):
+            for programs in ("Program Files", "Program Files (x86)"):
+                candidates.append(os.path.join(drive, programs, "Blackmagic Design", "DaVinci Resolve", "Resolve.exe"))
+                candidates.append(os.path.join(drive, programs, "DaVinci Resolve", "Resolve.exe"))
+
+    elif system == "Linux":
+        candidates += ["/opt/resolve/bin/resolve",
+                       "/opt/resolve-studio/bin/resolve",
+                       "/home/resolve/bin/resolve"
+                       ]
+
+    elif system == "Darwin":
+        candidates.append("/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/MacOS/Resolve")
+
+    return candidates
+
+
+#   Scripting Module Folder Candidates in Priority Order
+def getScriptModuleCandidates(system=None):
+    system = system or platform.system()
+    candidates = []
+
+    if os.environ.get(SCRIPT_PATH_VAR):
+        candidates.append(os.environ[SCRIPT_PATH_VAR])
+    if os.environ.get(RESOLVE_API_VAR):
+        candidates.append(os.path.join(os.environ[RESOLVE_API_VAR], "Modules"))
+
+    if system == "Windows":
+        programData = os.environ.get("PROGRAMDATA", os.path.join("C:\\", "ProgramData"))
+        candidates.append(os.path.join(programData, "Blackmagic Design", "DaVinci Resolve",
+                                       "Support", "Developer", "Scripting", "Modules"))
+
+    elif system == "Linux":
+        candidates += ["/opt/resolve/Developer/Scripting/Modules",
+                       "/opt/resolve-studio/Developer/Scripting/Modules",
+                       "/home/resolve/Developer/Scripting/Modules"
+                       ]
+
+    elif system == "Darwin":
+        candidates.append("/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules")
+
+    return candidates
+
+
+def isResolveExe(path):
+    return os.path.isfile(path)
+
+
+def isScriptModules(path):
+    return os.path.isfile(os.path.join(path, RESOLVE_SCRIPT_MODULE))
+
+
+#   Validates all Candidates Concurrently and Returns the First Valid one in Priority Order
+def probeCandidates(candidates, validate):
+    if not candidates:
+        return None
+
+    workers = min(MAX_PROBE_WORKERS, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ResolveShortcutsDiscovery") as executor:
+        results = list(executor.map(validate, candidates))
+
+    for path, valid in zip(candidates, results):
+        if valid:
+            return path
+
+    return None
+
+
+def getMtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+#   Discovered Paths with the mtimes they had when Found
+class PathDiscovery(object):
+    def __init__(self, cacheFile, scope=None):
+        self.cacheFile = cacheFile
+        self.scope = scope
+        self.entries = None
+        self._lock = threading.Lock()
+
+
+    #   Entries are Dropped if the Cache was Made for a Different Scope (Prism root)
+    def loadCache(self):
+        if self.entries is None:
+            self.entries = {}
+            try:
+                with open(self.cacheFile, "r") as file:
+                    data = json.load(file)
+                if data.get("scope") == self.scope:
+                    self.entries = data.get("paths", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+        return self.entries
+
+
+    def saveCache(self):
+        tempPath = f"{self.cacheFile}.{os.getpid()}.tmp"
+        try:
+            with open(tempPath, "w") as file:
+                json.dump({"scope": self.scope, "paths": self.entries}, file, indent=4)
+            os.replace(tempPath, self.cacheFile)
+
+        except OSError as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to save path cache: {e}")
+
+
+    #   Cached Path if it Still has the Same mtime and Signature, Else None
+    def getCached(self, key, signature=None):
+        with self._lock:
+            entry = self.loadCache().get(key)
+
+        if not isinstance(entry, dict) or not entry.get("path"):
+            return None
+        if entry.get("signature") != signature:
+            return None
+        if entry.get("mtime") is None or getMtime(entry["path"]) != entry["mtime"]:
+            return None
+
+        return entry["path"]
+
+
+    #   Returns the Cached Path, or Runs finder() and Caches what it Returns.
+    #   The Signature (such as Environment Overrides) Invalidates the Entry when it Changes
+    def get(self, key, finder, refresh=False, signature=None):
+        if not refresh:
+            path = self.getCached(key, signature)
+            if path:
+                return path
+
+        path = finder()
+
+        with self._lock:
+            entries = self.loadCache()
+            if path:
+                entries[key] = {"path": path,
+                                "mtime": getMtime(path),
+                                "signature": signature
+                                }
+            else:
+                entries.pop(key, None)
+            self.saveCache()
+
+        return path
+
+
+    def findResolveExe(self, refresh=False):
+        return self.get("resolve_exe",
+                        lambda: probeCandidates(getResolveExeCandidates(), isResolveExe),
+                        refresh,
+                        os.environ.get(RESOLVE_EXE_VAR)
+                        )
+
+
+    def findScriptModules(self, refresh=False):
+        return self.get("dvr_script_path",
+                        lambda: probeCandidates(getScriptModuleCandidates(), isScriptModules),
+                        refresh,
+                        [os.environ.get(SCRIPT_PATH_VAR), os.environ.get(RESOLVE_API_VAR)]
+                        )
+
+
+#   Prints the Discovered Paths
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find the DaVinci Resolve install used by ResolveShortcuts")
+    parser.add_argument("--cache", help="Path cache file to use (default: no cache)")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached paths")
+    args = parser.parse_args()
+
+    if args.cache:
+        discovery = PathDiscovery(args.cache)
+        resolveExe = discovery.findResolveExe(args.refresh)
+        scriptModules = discovery.findScriptModules(args.refresh)
+    else:
+        resolveExe = probeCandidates(getResolveExeCandidates(), isResolveExe)
+        scriptModules = probeCandidates(getScriptModuleCandidates(), isScriptModules)
+
+    print(json.dumps({"resolve_exe": resolveExe, "dvr_script_path": scriptModules}, indent=4))
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Local SQLite history of shortcut opens.  Each open is stored with its
+#   shortcut, database, project, timeline, phase durations and outcome, and
+#   the project load times are used to learn a project load timeout for
+#   each project: long enough for a large cloud database project, short
+#   enough that a small local project reports a real failure quickly.
+#
+#   Report of the history from the command line:
+#       python ResolveShortcuts_History.py [path/to/ResolveShortcuts_History.db]
+#
+####################################################
+
+
+import os
+import json
+import sqlite3
+import contextlib
+
+from ResolveShortcuts_Timing import percentile
+
+
+#   Globals
+HISTORY_DB_NAME = "ResolveShortcuts_History.db"
+HISTORY_WINDOW = 50                 #   Newest opens of a project used for its stats
+HISTORY_MIN_SAMPLES = 3             #   Successful loads needed before a timeout is learned
+HISTORY_TIMEOUT_FACTOR = 2.0        #   Learned timeout is p95 load time * factor + margin
+HISTORY_TIMEOUT_MARGIN = 5
+HISTORY_MIN_TIMEOUT = 10
+HISTORY_MAX_TIMEOUT = 900
+
+#   Phases that Make Up the Project Load
+LOAD_PHASES = ("load_project", "project_wait")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS opens (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time TEXT,
+    shortcut TEXT,
+    path TEXT,
+    db TEXT,
+    project TEXT,
+    timeline TEXT,
+    outcome TEXT,
+    total_ms REAL,
+    load_ms REAL,
+    project_timeout REAL,
+    phases TEXT
+);
+CREATE INDEX IF NOT EXISTS opens_project ON opens (db, project, id);
+"""
+
+
+class OpenHistory(object):
+    def __init__(self, dbPath):
+        self.dbPath = dbPath
+        self.isReady = False
+
+
+    #   Short-lived Connection, so the History can be Used from any Thread or Process
+    @contextlib.contextmanager
+    def connect(self):
+        conn = sqlite3.connect(self.dbPath, timeout=5)
+        try:
+            if not self.isReady:
+                conn.executescript(SCHEMA)
+                self.isReady = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+    #   Stores a Timing Record of an Open (See ResolveShortcuts_Timing).  Opens that
+    #   did not Load the Project (Already Open, or Failed Before) have no load_ms
+    def add(self, record):
+        phases = record.get("phases") or {}
+        loadPhases = [phases[name] for name in LOAD_PHASES if name in phases]
+
+        try:
+            with self.connect() as conn:
+                conn.execute("INSERT INTO opens (time, shortcut, path, db, project, timeline, outcome,"
+                             " total_ms, load_ms, project_timeout, phases) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (record.get("time"),
+                              record.get("shortcut"),
+                              record.get("path"),
+                              record.get("db"),
+                              record.get("project"),
+                              record.get("timeline"),
+                              record.get("outcome"),
+                              record.get("total_ms"),
+                              sum(loadPhases) if loadPhases else None,
+                              record.get("project_timeout"),
+                              json.dumps(phases)
+                              ))
+            return True
+
+        except sqlite3.Error as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to write open history: {e}")
+            return False
+
+
+    #   Newest Opens of a Project as (outcome, total_ms, load_ms, project_timeout) Rows
+    def getOpens(self, dbName, projectName, limit=HISTORY_WINDOW):
+        with self.connect() as conn:
+            return conn.execute("SELECT outcome, total_ms, load_ms, project_timeout FROM opens"
+                                " WHERE db = ? AND project = ? ORDER BY id DESC LIMIT ?",
+                                (dbName, projectName, limit)
+                                ).fetchall()
+
+
+    #   Project Load Timeout (seconds) Learned from the Project's History.  Uses the Default
+    #   Until there are Enough Successful Loads, and Doubles the Last Timeout if it Ran Out
+    def learnTimeout(self, dbName, projectName, default):
+        try:
+            opens = self.getOpens(dbName, projectName)
+        except sqlite3.Error as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to read open history: {e}")
+            return default
+
+        loadTimes = sorted(row[2] for row in opens if row[0] == "ok" and row[2] is not None)
+        if len(loadTimes) >= HISTORY_MIN_SAMPLES:
+            timeout = percentile(loadTimes, 95) / 1000 * HISTORY_TIMEOUT_FACTOR + HISTORY_TIMEOUT_MARGIN
+            timeout = min(max(timeout, HISTORY_MIN_TIMEOUT), HISTORY_MAX_TIMEOUT)
+        else:
+            timeout = default
+
+        lastLoad = next((row for row in opens if row[2] is not None), None)
+        if lastLoad and lastLoad[0] == "timeout" and lastLoad[3]:
+            timeout = max(timeout, min(lastLoad[3] * 2, HISTORY_MAX_TIMEOUT))
+
+        return timeout
+
+
+    #   Open Counts, p50/p95 (ms) and Learned Timeout per Project, Slowest p95 First
+    def getProjectStats(self, default):
+        with self.connect() as conn:
+            projects = conn.execute("SELECT db, project FROM opens WHERE project IS NOT NULL"
+                                    " GROUP BY db, project ORDER BY MAX(id) DESC"
+                                    ).fetchall()
+
+        stats = []
+        for dbName, projectName in projects:
+            opens = self.getOpens(dbName, projectName)
+            totals = sorted(row[1] for row in opens if row[0] == "ok" and row[1] is not None)
+            loads = sorted(row[2] for row in opens if row[0] == "ok" and row[2] is not None)
+
+            stats.append({"db": dbName,
+                          "project": projectName,
+                          "opens": len(opens),
+                          "failed": sum(1 for row in opens if row[0] != "ok"),
+                          "p50": percentile(totals, 50),
+                          "p95": percentile(totals, 95),
+                          "load_p50": percentile(loads, 50),
+                          "load_p95": percentile(loads, 95),
+                          "timeout": self.learnTimeout(dbName, projectName, default)
+                          })
+
+        return sorted(stats, key=lambda stat: stat["p95"] or 0, reverse=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from ResolveShortcuts_Config import DEFAULT_TIMEOUTS
+
+    parser = argparse.ArgumentParser(description="Report the ResolveShortcuts open history per project")
+    parser.add_argument("db", nargs="?", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                              HISTORY_DB_NAME))
+    parser.add_argument("--project", default=None, help="Only projects whose name contains this text")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.db):
+        print(f"No open history at {args.db}")
+        raise SystemExit(1)
+
+    def seconds(ms):
+        return "-" if ms is None else f"{ms / 1000:.2f}"
+
+    stats = OpenHistory(args.db).getProjectStats(DEFAULT_TIMEOUTS["project_timeout"])
+    if args.project:
+        stats = [stat for stat in stats if args.project.lower() in stat["project"].lower()]
+
+    print(f"{'database':<20}{'project':<30}{'opens':>7}{'failed':>8}{'p50':>8}{'p95':>8}"
+          f"{'load p50':>10}{'load p95':>10}{'timeout':>9}   (s)")
+    for stat in stats:
+        print(f"{stat['db'][:19]:<20}{stat['project'][:29]:<30}{stat['opens']:>7}{stat['failed']:>8}"
+              f"{seconds(stat['p50']):>8}{seconds(stat['p95']):>8}{seconds(stat['load_p50']):>10}"
+              f"{seconds(stat['load_p95']):>10}{stat['timeout']:>9.0f}")
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Resident shortcut launcher.  This is a long-lived process (started by the
+#   Prism tray) that keeps the ResolveShortcuts module imported and the Resolve
+#   API handle alive.  Shortcut files hand off their project path over a local
+#   socket and return immediately, instead of starting a new interpreter and
+#   re-connecting to Resolve for every open.  Every request must carry the
+#   token the launcher writes next to the config when it starts, so only
+#   processes that can read the plugin directory can use it.
+#
+####################################################
+
+
+import os
+import sys
+import hmac
+import json
+import queue
+import socket
+import secrets
+import argparse
+import threading
+import socketserver
+
+from ResolveShortcuts_Config import LAUNCHER_PORT
+
+
+#   Globals
+LAUNCHER_HOST = "127.0.0.1"
+LAUNCHER_TOKEN_FILE = "ResolveShortcuts_Launcher.token"
+
+
+#   Path of the Token File in the Plugin Directory (Next to the Config)
+def getTokenPath(pluginPath=None):
+    pluginPath = pluginPath or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(pluginPath, LAUNCHER_TOKEN_FILE)
+
+
+#   Returns the Token of the Running Launcher, or None if there is no Token File
+def readToken(tokenPath=None):
+    try:
+        with open(tokenPath or getTokenPath(), "r") as file:
+            return file.read().strip() or None
+    except OSError:
+        return None
+
+
+#   Writes a New Random Token Readable Only by this User
+def writeToken(tokenPath=None):
+    tokenPath = tokenPath or getTokenPath()
+    token = secrets.token_hex(16)
+    tempPath = f"{tokenPath}.{os.getpid()}.tmp"
+
+    try:
+        fd = os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            file.write(token)
+        os.replace(tempPath, tokenPath)
+
+    finally:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+
+    return token
+
+
+#   Sends a Request with the Launcher Token.  Returns the Reply Dict, or None if no Launcher Answered
+def sendRequest(request, port=LAUNCHER_PORT, timeout=0.5):
+    token = readToken()
+    if not token:
+        return None
+
+    request = dict(request, token=token)
+    try:
+        with socket.create_connection((LAUNCHER_HOST, int(port)), timeout=timeout) as sock:
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as reply:
+                line = reply.readline()
+
+        return json.loads(line) if line else None
+
+    except (OSError, ValueError):
+        return None
+
+
+#   Returns True if a Launcher is Listening on the Port
+def isLauncherRunning(port=LAUNCHER_PORT):
+    reply = sendRequest({"mode": "ping"}, port=port)
+    return bool(reply and reply.get("status") == "ok")
+
+
+#   Hands a Shortcut Open Off to the Launcher.  Returns True if the Launcher Accepted it
+def requestOpen(projectPath, shortcutFile=None, port=LAUNCHER_PORT, timelineIndex=None, timelineId=None,
+                projectId=None):
+    reply = sendRequest({"mode": "load",
+                         "path": projectPath,
+                         "shortcutFile": shortcutFile,
+                         "timelineIndex": timelineIndex,
+                         "timelineId": timelineId,
+                         "projectId": projectId},
+                        port=port
+                        )
+    return bool(reply and reply.get("status") == "accepted")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+        except ValueError:
+            self._reply({"status": "error", "message": "Malformed request"})
+            return
+
+        if not isinstance(request, dict) or not hmac.compare_digest(str(request.get("token", "")),
+                                                                    self.server.launcher.token):
+            self._reply({"status": "error", "message": "Invalid token"})
+            return
+
+        mode = request.get("mode")
+
+        if mode == "ping":
+            self._reply({"status": "ok", "pid": os.getpid()})
+
+        elif mode == "load" and request.get("path"):
+            #   Queue the Job and Return at Once so the Shortcut Stub can Exit
+            self.server.launcher.jobs.put(request)
+            self._reply({"status": "accepted"})
+
+        elif mode == "shutdown":
+            self._reply({"status": "ok"})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+        else:
+            self._reply({"status": "error", "message": f"Unknown request: {mode}"})
+
+
+    def _reply(self, data):
+        self.wfile.write((json.dumps(data) + "\n").encode("utf-8"))
+
+
+class _LauncherServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = False
+    daemon_threads = True
+
+
+class ShortcutLauncher(object):
+    def __init__(self, port=LAUNCHER_PORT):
+        self.port = int(port)
+        self.jobs = queue.Queue()
+        self.shortcuts = None
+        self.token = None
+        self.tokenPath = getTokenPath()
+
+
+    #   Single Worker so all Resolve API Calls Happen in Order on One Thread.  The Loader is
+    #   Created and Connected Up Front so the First Handoff Does Not Pay for it
+    def worker(self):
+        from DvResolve_Project_Shortcuts import ResolveShortcuts
+
+        try:
+            self.shortcuts = ResolveShortcuts()
+            if self.shortcuts.connectResolve():
+                print("[ResolveShortcuts] Launcher connected to Resolve.")
+        except (Exception, SystemExit) as e:
+            print(f"[ResolveShortcuts] WARNING: Launcher could not connect to Resolve yet: {e}")
+
+        while True:
+            request = self.jobs.get()
+            try:
+                if self.shortcuts is None:
+                    self.shortcuts = ResolveShortcuts()
+
+                self.shortcuts.openResolveProject(request["path"],
+                                                  timelineIndex=request.get("timelineIndex"),
+                                                  timelineId=request.get("timelineId"),
+                                                  shortcutFile=request.get("shortcutFile"),
+                                                  projectId=request.get("projectId")
+                                                  )
+
+            except (Exception, SystemExit) as e:
+                print(f"[ResolveShortcuts] ERROR: Launcher job failed: {e}")
+
+            finally:
+                self.jobs.task_done()
+
+
+    def serve(self):
+        try:
+            server = _LauncherServer((LAUNCHER_HOST, self.port), _RequestHandler)
+        except OSError as e:
+            print(f"[ResolveShortcuts] Launcher not started, port {self.port} is in use: {e}")
+            return False
+
+        server.launcher = self
+
+        try:
+            self.token = writeToken(self.tokenPath)
+        except OSError as e:
+            print(f"[ResolveShortcuts] Launcher not started, unable to write {self.tokenPath}: {e}")
+            server.server_close()
+            return False
+
+        threading.Thread(target=self.worker, daemon=True).start()
+
+        print(f"[ResolveShortcuts] Launcher listening on {LAUNCHER_HOST}:{self.port}")
+        try:
+            with server:
+                server.serve_forever()
+
+        finally:
+            #   Only Remove the Token if Another Launcher has not Replaced it
+            if readToken(self.tokenPath) == self.token:
+                try:
+                    os.remove(self.tokenPath)
+                except OSError:
+                    pass
+
+        return True
+
+
+
+#   Started Detached by the Prism Tray
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve Shortcuts resident launcher")
+    parser.add_argument("--port", type=int, default=LAUNCHER_PORT, help="Local port to listen on")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    ShortcutLauncher(port=args.port).serve()
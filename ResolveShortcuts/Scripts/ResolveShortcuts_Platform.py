@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Platform integration for the shortcut file association and the
+#   PRISM_DVR_SHORTCUTS_PATH environment variable.  Each platform has its own
+#   backend (Windows registry, Linux xdg-mime and desktop entry, and a fake
+#   for testing), and HealthProbe caches their status checks and refreshes
+#   them on a background thread so the settings UI never waits on them.
+#
+####################################################
+
+
+import os
+import platform
+import threading
+import subprocess
+import logging
+
+from ResolveShortcuts_Config import EXTENSION, SHORTCUTS_ENVIRO_VAR
+
+
+logger = logging.getLogger(__name__)
+
+
+#   Globals
+PLATFORM_OVERRIDE_VAR = "RESOLVE_SHORTCUTS_PLATFORM"
+
+
+#   Base Backend.  Subclasses Implement the Set and Remove Methods
+class PlatformBackend(object):
+    name = "Base"
+    supported = True
+
+    def checkFileAssoc(self):
+        return False
+
+    def setFileAssoc(self, pythonExe):
+        raise NotImplementedError(f"File association is not supported on {platform.system()}")
+
+    def removeFileAssoc(self):
+        raise NotImplementedError(f"File association is not supported on {platform.system()}")
+
+    def checkEnviroVar(self):
+        return bool(os.environ.get(SHORTCUTS_ENVIRO_VAR))
+
+    def setEnviroVar(self, value):
+        raise NotImplementedError(f"Setting environment variables is not supported on {platform.system()}")
+
+    def removeEnviroVar(self):
+        raise NotImplementedError(f"Removing environment variables is not supported on {platform.system()}")
+
+    #   Runs all Status Checks
+    def probe(self):
+        return {"fileAssoc": self.checkFileAssoc(),
+                "enviroVar": self.checkEnviroVar()
+                }
+
+
+class WindowsBackend(PlatformBackend):
+    name = "Windows"
+
+    def __init__(self):
+        import winreg
+        self.winreg = winreg
+
+
+    #   Checks for file association
+    def checkFileAssoc(self):
+        winreg = self.winreg
+        try:
+            #   Check what file type is associated with .resolveShortcut
+            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, EXTENSION, 0, winreg.KEY_READ) as key:
+                fileType, _ = winreg.QueryValueEx(key, None)
+
+            #   If there's no file type associated, return False
+            if not fileType:
+                return False
+
+            #   Check what command is associated with opening that file type
+            command_key = f"{fileType}\\shell\\open\\command"
+            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, command_key, 0, winreg.KEY_READ) as key:
+                command, _ = winreg.QueryValueEx(key, None)
+
+            return "python.exe" in command.lower()
+
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"ERROR: checking file association: {e}")
+            return False
+
+
+    def setFileAssoc(self, pythonExe):
+        winreg = self.winreg
+
+        # Associate the extension with a file type (User level)
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\{EXTENSION}") as key:
+            winreg.SetValue(key, "", winreg.REG_SZ, "PythonFile")
+
+        # Set the command to open with Python (User level).  Isolated and site-free for faster startup
+        command = f'"{pythonExe}" -I -S "%1"'
+        with winreg.CreateKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\PythonFile\\shell\\open\\command") as key:
+            winreg.SetValue(key, "", winreg.REG_SZ, command)
+
+        logger.debug(f"Successfully associated {EXTENSION} files with Python.")
+
+        # Tell Windows to refresh file associations (User level)
+        subprocess.run(["assoc", f"{EXTENSION}=PythonFile"], shell=True)
+        subprocess.run(["ftype", f"PythonFile={command}"], shell=True)
+
+
+    def removeFileAssoc(self):
+        winreg = self.winreg
+
+        # Delete the file extension association (User level)
+        winreg.DeleteKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\{EXTENSION}")
+
+        # Delete the command to open with Python (User level)
+        winreg.DeleteKey(winreg.HKEY_CURRENT_USER, f"Software\\Classes\\PythonFile\\shell\\open\\command")
+
+        # Delete the PythonFile association if no other references exist
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Classes", 0, winreg.KEY_READ) as classes_key:
+            try:
+                winreg.OpenKey(classes_key, "PythonFile")
+                winreg.DeleteKey(winreg.HKEY_CURRENT_USER, "Software\\Classes\\PythonFile")
+            except FileNotFoundError:
+                pass  # No need to delete if it doesn't exist
+
+        logger.debug(f"Successfully removed {EXTENSION} file association.")
+
+        # Refresh Windows file associations
+        subprocess.run(["assoc", f"{EXTENSION}="], shell=True)
+        subprocess.run(["ftype", "PythonFile="], shell=True)
+
+
+    def setEnviroVar(self, value):
+        subprocess.run(['setx', SHORTCUTS_ENVIRO_VAR, value], check=True)
+
+
+    def removeEnviroVar(self):
+        subprocess.run(['setx', SHORTCUTS_ENVIRO_VAR, ""], check=True)
+
+
+#   Uses a Shared MIME Type, a Desktop Entry and xdg-mime
+class LinuxBackend(PlatformBackend):
+    name = "Linux"
+    mimeType = "application/x-resolveshortcut"
+    desktopName = "resolveshortcut.desktop"
+
+    def __init__(self):
+        dataHome = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        configHome = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+        self.mimeDir = os.path.join(dataHome, "mime")
+        self.mimeFile = os.path.join(self.mimeDir, "packages", "resolveshortcut.xml")
+        self.desktopFile = os.path.join(dataHome, "applications", self.desktopName)
+        self.enviroFile = os.path.join(configHome, "environment.d", "resolveshortcuts.conf")
+
+
+    def checkFileAssoc(self):
+        if not (os.path.isfile(self.mimeFile) and os.path.isfile(self.desktopFile)):
+            return False
+
+        try:
+            result = subprocess.run(["xdg-mime", "query", "default", self.mimeType],
+                                    capture_output=True,
+                                    text=True,
+                                    timeout=5
+                                    )
+            return result.stdout.strip() == self.desktopName
+
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"ERROR: checking file association: {e}")
+            return False
+
+
+    def setFileAssoc(self, pythonExe):
+        os.makedirs(os.path.dirname(self.mimeFile), exist_ok=True)
+        with open(self.mimeFile, "w") as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       '<mime-info xmlns="http://www.freedesktop.org/standards/shared-mime-info">\n'
+                       f'  <mime-type type="{self.mimeType}">\n'
+                       '    <comment>Resolve Project Shortcut</comment>\n'
+                       f'    <glob pattern="*{EXTENSION}"/>\n'
+                       '  </mime-type>\n'
+                       '</mime-info>\n')
+
+        os.makedirs(os.path.dirname(self.desktopFile), exist_ok=True)
+        with open(self.desktopFile, "w") as file:
+            file.write("[Desktop Entry]\n"
+                       "Type=Application\n"
+                       "Name=Resolve Project Shortcut\n"
+                       f'Exec="{pythonExe}" -I -S %f\n'
+                       f"MimeType={self.mimeType};\n"
+                       "NoDisplay=true\n"
+                       "Terminal=false\n")
+
+        subprocess.run(["update-mime-database", self.mimeDir], check=False)
+        subprocess.run(["xdg-mime", "default", self.desktopName, self.mimeType], check=True)
+
+        logger.debug(f"Successfully associated {EXTENSION} files with Python.")
+
+
+    def removeFileAssoc(self):
+        for filePath in (self.mimeFile, self.desktopFile):
+            if os.path.isfile(filePath):
+                os.remove(filePath)
+
+        subprocess.run(["update-mime-database", self.mimeDir], check=False)
+
+        logger.debug(f"Successfully removed {EXTENSION} file association.")
+
+
+    #   Picked up by the systemd user session at the next login
+    def setEnviroVar(self, value):
+        os.makedirs(os.path.dirname(self.enviroFile), exist_ok=True)
+        with open(self.enviroFile, "w") as file:
+            file.write(f"{SHORTCUTS_ENVIRO_VAR}={value}\n")
+
+
+    def removeEnviroVar(self):
+        if os.path.isfile(self.enviroFile):
+            os.remove(self.enviroFile)
+
+
+#   Reports Everything as Unavailable on Platforms Without a Backend (such as macOS)
+class UnsupportedBackend(PlatformBackend):
+    name = "Unsupported"
+    supported = False
+
+    def __init__(self, system=None):
+        self.system = system or platform.system()
+
+    def checkFileAssoc(self):
+        return False
+
+    def setFileAssoc(self, pythonExe):
+        logger.warning(f"File association is not supported on {self.system}")
+        return False
+
+    def removeFileAssoc(self):
+        logger.warning(f"File association is not supported on {self.system}")
+        return False
+
+    def setEnviroVar(self, value):
+        logger.warning(f"Setting environment variables is not supported on {self.system}")
+        return False
+
+    def removeEnviroVar(self):
+        logger.warning(f"Removing environment variables is not supported on {self.system}")
+        return False
+
+
+#   In-memory Backend for Tests and Headless Machines
+class FakeBackend(PlatformBackend):
+    name = "Fake"
+
+    def __init__(self, fileAssoc=False, enviroVar=False, delay=0):
+        self.fileAssoc = fileAssoc
+        self.enviroVar = enviroVar
+        self.delay = delay
+        self.calls = []
+
+    def _call(self, name):
+        self.calls.append(name)
+        if self.delay:
+            threading.Event().wait(self.delay)
+
+    def checkFileAssoc(self):
+        self._call("checkFileAssoc")
+        return self.fileAssoc
+
+    def setFileAssoc(self, pythonExe):
+        self._call("setFileAssoc")
+        self.fileAssoc = True
+
+    def removeFileAssoc(self):
+        self._call("removeFileAssoc")
+        self.fileAssoc = False
+
+    def checkEnviroVar(self):
+        self._call("checkEnviroVar")
+        return self.enviroVar
+
+    def setEnviroVar(self, value):
+        self._call("setEnviroVar")
+        self.enviroVar = True
+
+    def removeEnviroVar(self):
+        self._call("removeEnviroVar")
+        self.enviroVar = False
+
+
+#   Returns the Backend for this Platform.  RESOLVE_SHORTCUTS_PLATFORM=fake Forces the Fake
+def getBackend(system=None):
+    system = system or os.environ.get(PLATFORM_OVERRIDE_VAR) or platform.system()
+
+    if system.lower() == "fake":
+        return FakeBackend()
+    if system == "Windows":
+        return WindowsBackend()
+    if system == "Linux":
+        return LinuxBackend()
+
+    return UnsupportedBackend(system)
+
+
+#   Cached Backend Status, Refreshed on a Background Thread
+class HealthProbe(object):
+    def __init__(self, backend, onUpdate=None):
+        self.backend = backend
+        self.onUpdate = onUpdate
+        self.results = None
+        self._thread = None
+        self._pending = False
+        self._lock = threading.Lock()
+
+
+    #   Last Probe Results, or None if no Probe has Finished Yet
+    def get(self):
+        return self.results
+
+
+    #   Starts a Background Probe.  If One is Running, Another Runs Right After it
+    def refresh(self, block=False):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                self._pending = True
+                thread = self._thread
+            else:
+                self._pending = False
+                thread = threading.Thread(target=self._run, name="ResolveShortcutsProbe", daemon=True)
+                self._thread = thread
+                thread.start()
+
+        if block:
+            thread.join()
+            while self._thread is not thread:
+                thread = self._thread
+                thread.join()
+
+        return self.results
+
+
+    def _run(self):
+        while True:
+            try:
+                results = self.backend.probe()
+            except Exception as e:
+                logger.warning(f"ERROR: platform probe failed: {e}")
+                results = {"fileAssoc": False, "enviroVar": False}
+
+            self.results = results
+            if self.onUpdate:
+                self.onUpdate(results)
+
+            with self._lock:
+                if not self._pending:
+                    return
+                self._pending = False
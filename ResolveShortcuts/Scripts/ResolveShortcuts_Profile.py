@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Opt-in cProfile hooks for the shortcut loader and the Prism callbacks.
+#   Each profiled call writes a pstats file to the Profiles folder in the
+#   plugin directory, so a shortcut opened by the file association can be
+#   profiled in the field.  Calls made per file row (setIcon) are collected
+#   into one profile that is written every few thousand calls and at exit.
+#
+#   Enabled with RESOLVE_SHORTCUTS_PROFILE=1 or "profile=True" in the config.
+#   Report of a profile (or the newest in a folder) from the command line:
+#       python ResolveShortcuts_Profile.py [path/to/Profiles] [--name open]
+#
+####################################################
+
+
+import os
+import time
+import atexit
+import functools
+import threading
+import itertools
+
+from ResolveShortcuts_Config import PROFILE_DIR_NAME
+
+
+#   Globals
+PROFILE_EXT = ".prof"
+PROFILE_KEEP = 200                  #   Newest profiles kept in the folder
+AGGREGATE_CALLS = 5000              #   Calls between writes of an aggregated profile
+
+#   cProfile Only Sees its Own Thread, so Each Thread Profiles its Own Calls.  Calls Nested
+#   in a Profiled Call on the Same Thread are Already Covered and Run Unprofiled
+_profileState = threading.local()
+_counter = itertools.count(1)
+
+
+#   cProfile is Imported on First Use, so Importing the Decorators Stays Cheap
+def newProfiler():
+    import cProfile
+    return cProfile.Profile()
+
+
+#   Unique Profile Path: name_date-time_pid_n.prof
+def getProfilePath(profileDir, name):
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(profileDir, f"{name}_{stamp}_{os.getpid()}_{next(_counter)}{PROFILE_EXT}")
+
+
+#   Writes the Stats of a Profiler and Removes the Oldest Profiles Over the Limit
+def saveProfile(profiler, profileDir, name):
+    try:
+        os.makedirs(profileDir, exist_ok=True)
+        profilePath = getProfilePath(profileDir, name)
+        profiler.dump_stats(profilePath)
+
+    except (OSError, TypeError) as e:
+        print(f"[ResolveShortcuts] WARNING: Unable to write profile: {e}")
+        return None
+
+    profiles = sorted((entry for entry in os.scandir(profileDir) if entry.name.endswith(PROFILE_EXT)),
+                      key=lambda entry: entry.stat().st_mtime)
+    for entry in profiles[:-PROFILE_KEEP]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+    return profilePath
+
+
+#   Runs func Under cProfile and Writes a Profile for the Call
+def runProfiled(profileDir, name, func, *args, **kwargs):
+    if getattr(_profileState, "active", False):
+        return func(*args, **kwargs)
+
+    profiler = newProfiler()
+    try:
+        profiler.enable()
+    except ValueError:
+        #   Another Profiling Tool is Active
+        return func(*args, **kwargs)
+
+    _profileState.active = True
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _profileState.active = False
+        profiler.disable()
+        saveProfile(profiler, profileDir, name)
+
+
+#   Decorator for Methods: Profiles Each Call When self.profileDir is Set
+def profiled(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profileDir = getattr(self, "profileDir", None)
+            if not profileDir:
+                return func(self, *args, **kwargs)
+
+            return runProfiled(profileDir, name, func, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+#   One Profiler Shared by Many Short Calls, Written Every AGGREGATE_CALLS Calls and at Exit
+class AggregateProfile(object):
+    def __init__(self, name):
+        self.name = name
+        self.profiler = None
+        self.profileDir = None
+        self.calls = 0
+        self._lock = threading.Lock()
+
+
+    #   The Shared Profiler can Only Run on One Thread at a Time, Other Calls Run Unprofiled
+    def run(self, profileDir, func, *args, **kwargs):
+        if getattr(_profileState, "active", False) or not self._lock.acquire(blocking=False):
+            return func(*args, **kwargs)
+
+        try:
+            if self.profiler is None:
+                self.profiler = newProfiler()
+                self.profileDir = profileDir
+                atexit.register(self.save)
+
+            try:
+                self.profiler.enable()
+            except ValueError:
+                return func(*args, **kwargs)
+
+            _profileState.active = True
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _profileState.active = False
+                self.profiler.disable()
+                self.calls += 1
+                if self.calls >= AGGREGATE_CALLS:
+                    self.save()
+
+        finally:
+            self._lock.release()
+
+
+    #   Writes the Collected Calls and Starts a New Profile
+    def save(self):
+        if self.profiler is None or not self.calls:
+            return None
+
+        profilePath = saveProfile(self.profiler, self.profileDir, f"{self.name}_x{self.calls}")
+        self.profiler = newProfiler()
+        self.calls = 0
+        return profilePath
+
+
+#   Decorator for Methods Called per Row: Collects the Calls into One Profile
+def aggregated(name):
+    aggregate = AggregateProfile(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profileDir = getattr(self, "profileDir", None)
+            if not profileDir:
+                return func(self, *args, **kwargs)
+
+            return aggregate.run(profileDir, func, self, *args, **kwargs)
+
+        wrapper.aggregate = aggregate
+        return wrapper
+
+    return decorator
+
+
+#   Profile Files in a Folder, Oldest First, Optionally Only Those Starting with a Name
+def listProfiles(profileDir, name=None):
+    try:
+        entries = [entry for entry in os.scandir(profileDir)
+                   if entry.name.endswith(PROFILE_EXT) and (not name or entry.name.startswith(f"{name}_"))]
+    except OSError:
+        return []
+
+    return [entry.path for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime)]
+
+
+if __name__ == "__main__":
+    import pstats
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print a ResolveShortcuts profile")
+    parser.add_argument("path", nargs="?", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                                PROFILE_DIR_NAME),
+                        help="Profile file, or a Profiles folder to use the newest profile")
+    parser.add_argument("--name", default=None, help="Only profiles of this name (open, save, saveall, setIcon, userSettings_loadUI)")
+    parser.add_argument("--all", action="store_true", help="Combine all matching profiles in the folder")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key")
+    parser.add_argument("--limit", type=int, default=30, help="Functions listed")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.path):
+        profiles = listProfiles(args.path, args.name)
+        if not args.all:
+            profiles = profiles[-1:]
+    else:
+        profiles = [args.path]
+
+    if not profiles:
+        print(f"No profiles found in {args.path}")
+        raise SystemExit(1)
+
+    print("\n".join(profiles))
+    stats = pstats.Stats(*profiles)
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.limit)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Local cache of shortcut preview images.  Previews are stored by a hash of
+#   the project ID, timeline ID and record timecode, so saving another
+#   shortcut to the same frame reuses the preview instead of capturing a new
+#   still in Resolve.  The Resolve API has no timeline or grade modified
+#   stamp, so a preview can go stale if the frame is regraded or edited;
+#   deleting the cache folder forces new captures.  The cache is size-bounded
+#   and evicts the least recently used previews.
+#
+####################################################
+
+
+import os
+import shutil
+import hashlib
+
+from ResolveShortcuts_Config import THUMB_CACHE_MB
+
+
+#   Globals
+THUMB_CACHE_DIR = "ThumbnailCache"
+THUMB_EXT = ".jpg"
+
+
+class ThumbnailCache(object):
+    def __init__(self, cacheDir, maxMB=THUMB_CACHE_MB):
+        self.cacheDir = cacheDir
+        self.maxBytes = int(float(maxMB) * 1024 * 1024)
+
+
+    #   Builds the Cache Key.  Returns None if the Frame Cannot be Identified
+    @staticmethod
+    def makeKey(projectId, timelineId, timecode):
+        if not (projectId and timelineId and timecode):
+            return None
+
+        keyText = "|".join([projectId, timelineId, timecode])
+        return hashlib.sha1(keyText.encode("utf-8")).hexdigest()
+
+
+    def getPath(self, key):
+        return os.path.join(self.cacheDir, key[:2], key + THUMB_EXT)
+
+
+    #   Returns the Cached Preview Path, or None.  A Hit Marks the Entry as Recently Used
+    def get(self, key):
+        if not key:
+            return None
+
+        cachePath = self.getPath(key)
+        try:
+            os.utime(cachePath, None)
+            return cachePath
+        except OSError:
+            return None
+
+
+    #   Moves an Image File into the Cache and Evicts Old Entries if Over Size
+    def put(self, key, imagePath):
+        if not key or self.maxBytes <= 0:
+            return None
+
+        cachePath = self.getPath(key)
+        try:
+            os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+            tempPath = f"{cachePath}.{os.getpid()}.tmp"
+            shutil.copyfile(imagePath, tempPath)
+            os.replace(tempPath, cachePath)
+
+        except OSError as e:
+            print(f"[ResolveShortcuts] WARNING: Unable to cache thumbnail: {e}")
+            return None
+
+        self.evict()
+        return cachePath
+
+
+    #   Removes Least Recently Used Entries Until the Cache Fits in maxBytes
+    def evict(self):
+        entries = []
+        totalBytes = 0
+
+        for root, dirs, files in os.walk(self.cacheDir):
+            for fileName in files:
+                if not fileName.endswith(THUMB_EXT):
+                    continue
+                filePath = os.path.join(root, fileName)
+                try:
+                    stat = os.stat(filePath)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filePath))
+                totalBytes += stat.st_size
+
+        if totalBytes <= self.maxBytes:
+            return 0
+
+        removed = 0
+        for mtime, size, filePath in sorted(entries):
+            try:
+                os.remove(filePath)
+                totalBytes -= size
+                removed += 1
+            except OSError:
+                continue
+
+            if totalBytes <= self.maxBytes:
+                break
+
+        return removed
+
+
+    def clear(self):
+        shutil.rmtree(self.cacheDir, ignore_errors=True)
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Timing spans for shortcut opens and saves.  Each operation records the
+#   duration of its phases (Resolve launch, API connect, folder navigation,
+#   project load, timeline lookup...) and is written as one JSON line to a
+#   size-rotated log next to the config, which the settings tab summarizes.
+#
+#   Summary of the log from the command line:
+#       python ResolveShortcuts_Timing.py [path/to/ResolveShortcuts_Timing.log]
+#
+####################################################
+
+
+import os
+import json
+import math
+import time
+import functools
+import contextlib
+
+
+#   Globals
+TIMING_LOG_NAME = "ResolveShortcuts_Timing.log"
+TIMING_LOG_BYTES = 1024 * 1024
+TIMING_LOG_BACKUPS = 3
+
+
+class OperationTimer(object):
+    def __init__(self, operation, **fields):
+        self.operation = operation
+        self.fields = fields
+        self.phases = {}
+        self.outcome = None
+        self.started = time.time()
+        self.start = time.perf_counter()
+
+
+    #   Adds the Time Spent in the Block to the Phase (Repeated Phases Accumulate)
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter() - start
+
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+
+    #   The Finished Operation as a Log Record, Times in ms
+    def finish(self, outcome=None):
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+                  "operation": self.operation,
+                  "outcome": outcome or self.outcome or "ok",
+                  "total_ms": round((time.perf_counter() - self.start) * 1000, 2),
+                  "phases": {name: round(secs * 1000, 2) for name, secs in self.phases.items()}
+                  }
+        record.update(self.fields)
+        return record
+
+
+    #   One Line for the Console, Slowest Phases First
+    def describe(self, record):
+        phases = sorted(record["phases"].items(), key=lambda item: item[1], reverse=True)
+        details = ", ".join(f"{name} {ms / 1000:.2f}s" for name, ms in phases)
+        return f"{record['operation']} {record['outcome']} in {record['total_ms'] / 1000:.2f}s ({details})"
+
+
+#   Decorator for ResolveShortcuts Methods: Times the Call in self.timer and Logs the Record.
+#   self.onTimingStart(timer) and self.onTimingRecord(record) are Called if Defined, and can
+#   Add Fields to the Record.  The Method can set self.timer.outcome; Otherwise Returning
+#   False Counts as "failed"
+def timedOperation(operation):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self.timer = OperationTimer(operation)
+            outcome = "error"
+
+            onStart = getattr(self, "onTimingStart", None)
+            if onStart:
+                onStart(self.timer)
+
+            try:
+                result = func(self, *args, **kwargs)
+                outcome = "failed" if result is False else "ok"
+                return result
+
+            finally:
+                timer, self.timer = self.timer, None
+                record = timer.finish(timer.outcome or outcome)
+
+                onRecord = getattr(self, "onTimingRecord", None)
+                if onRecord:
+                    onRecord(record)
+
+                print(f"[ResolveShortcuts] Timing: {timer.describe(record)}")
+                writeRecord(self.timingLogFile, record)
+
+        return wrapper
+
+    return decorator
+
+
+#   Times a Block in the Timer, or Does Nothing Without a Timer
+def timePhase(timer, name):
+    if timer is None:
+        return contextlib.nullcontext()
+    return timer.phase(name)
+
+
+#   Appends the Record to the Log, Rotating it to .1, .2 ... when it is Full
+def writeRecord(logPath, record):
+    try:
+        if os.path.exists(logPath) and os.path.getsize(logPath) >= TIMING_LOG_BYTES:
+            for index in range(TIMING_LOG_BACKUPS - 1, 0, -1):
+                if os.path.exists(f"{logPath}.{index}"):
+                    os.replace(f"{logPath}.{index}", f"{logPath}.{index + 1}")
+            os.replace(logPath, f"{logPath}.1")
+
+        with open(logPath, "a") as file:
+            file.write(json.dumps(record) + "\n")
+
+    except OSError as e:
+        print(f"[ResolveShortcuts] WARNING: Unable to write timing log: {e}")
+
+
+#   Records from the Log and its Backups, Oldest First.  Limit Keeps the Newest Records
+def readRecords(logPath, limit=None):
+    records = []
+    for path in [f"{logPath}.{index}" for index in range(TIMING_LOG_BACKUPS, 0, -1)] + [logPath]:
+        try:
+            with open(path, "r") as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+
+    if limit:
+        records = records[-limit:]
+
+    return records
+
+
+#   Nearest-rank Percentile of a Sorted List
+def percentile(values, pct):
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, math.ceil(pct / 100.0 * len(values)) - 1))
+    return values[index]
+
+
+#   Count, Mean, p50, p95 and Max (ms) of the Total and Each Phase, per Operation
+def summarize(records):
+    durations = {}
+    for record in records:
+        operation = record.get("operation", "?")
+        phases = durations.setdefault(operation, {})
+        phases.setdefault("total", []).append(record.get("total_ms", 0))
+        for name, ms in (record.get("phases") or {}).items():
+            phases.setdefault(name, []).append(ms)
+
+    summary = {}
+    for operation, phases in durations.items():
+        summary[operation] = {}
+        for name, values in phases.items():
+            values.sort()
+            summary[operation][name] = {"count": len(values),
+                                        "mean": sum(values) / len(values),
+                                        "p50": percentile(values, 50),
+                                        "p95": percentile(values, 95),
+                                        "max": values[-1]
+                                        }
+
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize the ResolveShortcuts timing log")
+    parser.add_argument("log", nargs="?", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                               TIMING_LOG_NAME))
+    parser.add_argument("--last", type=int, default=None, help="Only the newest N records")
+    args = parser.parse_args()
+
+    records = readRecords(args.log, args.last)
+    failed = sum(1 for record in records if record.get("outcome") != "ok")
+    print(f"{len(records)} records ({failed} not ok) in {args.log}\n")
+
+    for operation, phases in summarize(records).items():
+        print(f"{operation}:")
+        print(f"    {'phase':<16}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}   (ms)")
+        for name, stats in phases.items():
+            print(f"    {name:<16}{stats['count']:>7}{stats['mean']:>10.1f}{stats['p50']:>10.1f}"
+                  f"{stats['p95']:>10.1f}{stats['max']:>10.1f}")
+        print()
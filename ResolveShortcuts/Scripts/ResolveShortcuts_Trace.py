@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+#
+####################################################
+####################################################
+####################################################
+#
+#         RESOLVE SHORTCUTS PLUGIN
+#           by Joshua Breckeen
+#                Alta Arts
+#
+#   Opt-in tracing of Resolve scripting API calls.  Every API call is a
+#   round-trip to Resolve, so the number of calls is what an open or save
+#   costs.  ApiTracer wraps the resolve object and every object it returns
+#   in a TracedObject, which counts and times each call by name.  The calls
+#   of each shortcut operation are written to a trace log next to the config.
+#
+#   Enabled with RESOLVE_SHORTCUTS_TRACE=1 or "trace_api=True" in the config.
+#   Report of the trace log from the command line:
+#       python ResolveShortcuts_Trace.py [path/to/ResolveShortcuts_Trace.log]
+#
+####################################################
+
+
+import os
+import time
+import threading
+
+from ResolveShortcuts_Timing import readRecords
+
+
+#   Globals
+TRACE_ENV_VAR = "RESOLVE_SHORTCUTS_TRACE"
+TRACE_LOG_NAME = "ResolveShortcuts_Trace.log"
+TRACE_REPORT_CALLS = 10
+
+#   Returned as-is, Everything Else from the API is Wrapped
+PLAIN_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+#   True if Tracing is Enabled by the Environment or the Config
+def isTraceEnabled(configData=None):
+    if os.environ.get(TRACE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return True
+
+    return (configData or {}).get("trace_api") == "True"
+
+
+#   Replaces Traced Objects in API Call Arguments with the Objects they Wrap
+def unwrap(value):
+    if isinstance(value, TracedObject):
+        return value._target
+    if isinstance(value, list):
+        return [unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: unwrap(item) for key, item in value.items()}
+
+    return value
+
+
+#   Proxy for a Resolve API Object.  Calls are Passed Through and Recorded in the Tracer
+class TracedObject(object):
+    __slots__ = ("_target", "_tracer")
+
+    def __init__(self, target, tracer):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_tracer", tracer)
+
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        tracer = self._tracer
+
+        def tracedCall(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = attr(*unwrap(args), **unwrap(kwargs))
+            finally:
+                tracer.record(name, time.perf_counter() - start)
+            return tracer.wrap(result)
+
+        return tracedCall
+
+
+    def __bool__(self):
+        return bool(self._target)
+
+    def __eq__(self, other):
+        return self._target == unwrap(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __repr__(self):
+        return f"TracedObject({self._target!r})"
+
+
+class ApiTracer(object):
+    def __init__(self):
+        self.calls = {}
+        self._lock = threading.Lock()
+
+
+    #   Wraps an API Object, or the API Objects in a List/Dict Result
+    def wrap(self, value):
+        if isinstance(value, PLAIN_TYPES) or isinstance(value, TracedObject):
+            return value
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self.wrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+
+        return TracedObject(value, self)
+
+
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self.calls.setdefault(name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+
+
+    #   Clears the Counts at the Start of an Operation
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+
+
+    #   Calls Since the Last Reset, Most Time First, Times in ms
+    def report(self):
+        with self._lock:
+            calls = sorted(self.calls.items(), key=lambda item: item[1][1], reverse=True)
+
+        return {"api_calls": sum(count for _, (count, _) in calls),
+                "api_ms": round(sum(seconds for _, (_, seconds) in calls) * 1000, 2),
+                "calls": {name: {"count": count, "ms": round(seconds * 1000, 2)} for name, (count, seconds) in calls}
+                }
+
+
+    #   Console Lines for a Report, Limited to the Most Expensive Calls
+    @staticmethod
+    def describe(report, limit=TRACE_REPORT_CALLS):
+        lines = [f"{report['api_calls']} API calls in {report['api_ms'] / 1000:.2f}s"]
+        for name, stats in list(report["calls"].items())[:limit]:
+            lines.append(f"    {name:<32}{stats['count']:>6} calls{stats['ms']:>10.1f} ms")
+
+        return lines
+
+
+#   Calls per Operation Across the Trace Log: Mean Calls and the Total Count and Time per Call
+def summarize(records):
+    summary = {}
+    for record in records:
+        operation = summary.setdefault(record.get("operation", "?"), {"count": 0, "api_calls": 0, "calls": {}})
+        operation["count"] += 1
+        operation["api_calls"] += record.get("api_calls", 0)
+
+        for name, stats in (record.get("calls") or {}).items():
+            total = operation["calls"].setdefault(name, {"count": 0, "ms": 0.0})
+            total["count"] += stats["count"]
+            total["ms"] += stats["ms"]
+
+    for operation in summary.values():
+        operation["mean_calls"] = operation["api_calls"] / operation["count"]
+        operation["calls"] = dict(sorted(operation["calls"].items(), key=lambda item: item[1]["ms"], reverse=True))
+
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize the ResolveShortcuts API trace log")
+    parser.add_argument("log", nargs="?", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                               TRACE_LOG_NAME))
+    parser.add_argument("--last", type=int, default=None, help="Only the newest N records")
+    parser.add_argument("--calls", type=int, default=TRACE_REPORT_CALLS, help="API calls listed per operation")
+    args = parser.parse_args()
+
+    records = readRecords(args.log, args.last)
+    print(f"{len(records)} traced operations in {args.log}\n")
+
+    for operation, stats in summarize(records).items():
+        print(f"{operation}: {stats['count']} operations, {stats['mean_calls']:.1f} API calls on average")
+        for name, call in list(stats["calls"].items())[:args.calls]:
+            print(f"    {name:<32}{call['count'] / stats['count']:>8.1f} per op{call['ms'] / stats['count']:>10.1f} ms per op")
+        print()